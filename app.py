@@ -3,8 +3,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import uvicorn
 from examples.review_classifier import analyze_app_reviews
-from google_play_scraper import app as gplay_app
-from google_play_scraper import reviews as gplay_reviews
+from google_play_scraper import Priority
+from google_play_scraper import app_async as gplay_app
+from google_play_scraper import reviews_async as gplay_reviews
 import asyncio
 import json
 from typing import Dict, Optional
@@ -70,7 +71,7 @@ async def run_analysis(job_id: str, app_id: str):
     try:
         logger.info(f"Fetching app info for {app_id}")
         # Fetch app info
-        app_info = gplay_app(app_id)
+        app_info = await gplay_app(app_id, priority=Priority.INTERACTIVE)
         logger.info(f"Successfully fetched app info: {app_info['title']}")
         
         analyses[job_id]['stage'] = 'Fetching reviews'
@@ -85,10 +86,11 @@ async def run_analysis(job_id: str, app_id: str):
         while review_count < max_reviews:
             try:
                 logger.info(f"Fetching reviews batch for {app_id} (count: {review_count})")
-                result, continuation_token = gplay_reviews(
+                result, continuation_token = await gplay_reviews(
                     app_id,
                     count=100,
-                    continuation_token=continuation_token
+                    continuation_token=continuation_token,
+                    priority=Priority.INTERACTIVE
                 )
                 reviews.extend(result)
                 review_count += len(result)
@@ -101,7 +103,7 @@ async def run_analysis(job_id: str, app_id: str):
                 })
                 logger.info(f"Successfully fetched {len(result)} reviews. Total: {review_count}")
                 
-                if not continuation_token:
+                if continuation_token.token is None:
                     break
             except Exception as e:
                 logger.error(f"Error fetching reviews batch: {str(e)}\n{traceback.format_exc()}")
@@ -0,0 +1,39 @@
+"""
+Time parse_dom with every Detail field against a metadata-refresh subset.
+
+    python -m benchmarks.bench_fields [saved_page.html ...]
+"""
+
+import timeit
+
+from benchmarks.pages import load_pages
+from google_play_scraper.features.app import parse_dom
+
+SUBSET = ["score", "ratings", "histogram", "installs", "version"]
+
+
+def main():
+    pages = load_pages()
+    number = 50
+
+    for i, dom in enumerate(pages):
+        full = parse_dom(dom, "app", "url")
+        subset = parse_dom(dom, "app", "url", fields=SUBSET)
+        assert all(subset[field] == full[field] for field in SUBSET)
+
+        print("page {} ({:.2f} MB)".format(i, len(dom) / 1e6))
+        for name, fields in [
+            ("all fields", None),
+            ("fields=" + ",".join(SUBSET), SUBSET),
+        ]:
+            seconds = (
+                timeit.timeit(
+                    lambda: parse_dom(dom, "app", "url", fields=fields), number=number
+                )
+                / number
+            )
+            print("  {:<50}{:8.3f} ms".format(name, seconds * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Time decoding every AF_initDataCallback payload with the stdlib json module
+against the backend picked by google_play_scraper.utils.json_backend.
+
+    python -m benchmarks.bench_json [saved_page.html ...]
+"""
+
+import json
+import timeit
+
+from benchmarks.pages import load_pages
+from google_play_scraper.utils.dom import iter_data_callbacks
+from google_play_scraper.utils.json_backend import BACKEND, loads
+
+
+def main():
+    pages = load_pages()
+    number = 20
+
+    for i, dom in enumerate(pages):
+        payloads = [dom[start:end] for _, (start, end) in iter_data_callbacks(dom)]
+        assert [json.loads(p) for p in payloads] == [loads(p) for p in payloads]
+
+        print("page {} ({:.2f} MB)".format(i, len(dom) / 1e6))
+        for name, func in [("json", json.loads), (BACKEND + " (selected)", loads)]:
+            seconds = (
+                timeit.timeit(lambda: [func(p) for p in payloads], number=number)
+                / number
+            )
+            print("  {:<28}{:8.2f} ms".format(name, seconds * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compare the single-pass AF_initDataCallback scanner with the previous
+SCRIPT/KEY/VALUE regex extraction.
+
+    python -m benchmarks.bench_parse_dom [saved_page.html ...]
+"""
+
+import json
+import re
+import timeit
+
+from benchmarks.pages import load_pages
+from google_play_scraper.features.app import parse_dom
+from google_play_scraper.utils.dom import (
+    decode_span,
+    iter_data_callbacks,
+    parse_data_callbacks,
+)
+
+SCRIPT = re.compile(r"AF_initDataCallback[\s\S]*?</script")
+KEY = re.compile("(ds:.*?)'")
+VALUE = re.compile(r"data:([\s\S]*?), sideChannel: {}}\);<\/")
+
+
+def regex_parse(dom: str) -> dict:
+    dataset = {}
+
+    for match in SCRIPT.findall(dom):
+        key_match = KEY.findall(match)
+        value_match = VALUE.findall(match)
+
+        if key_match and value_match:
+            dataset[key_match[0]] = json.loads(value_match[0])
+
+    return dataset
+
+
+def eager_parse(dom: str) -> dict:
+    return {key: decode_span(dom, span) for key, span in iter_data_callbacks(dom)}
+
+
+def regex_scan(dom: str) -> list:
+    return [
+        (KEY.findall(match)[0], VALUE.findall(match)[0])
+        for match in SCRIPT.findall(dom)
+    ]
+
+
+def main():
+    pages = load_pages()
+    number = 20
+
+    for i, dom in enumerate(pages):
+        assert regex_parse(dom) == dict(parse_data_callbacks(dom))
+
+        print("page {} ({:.2f} MB)".format(i, len(dom) / 1e6))
+        for name, func in [
+            ("regex scan", regex_scan),
+            ("single-pass scan", lambda d: list(iter_data_callbacks(d))),
+            ("regex scan + decode", regex_parse),
+            ("single-pass scan + decode", eager_parse),
+            ("parse_dom (lazy ds:*)", lambda d: parse_dom(d, "app", "url")),
+        ]:
+            seconds = timeit.timeit(lambda: func(dom), number=number) / number
+            print("  {:<28}{:8.2f} ms".format(name, seconds * 1000))
+
+
+if __name__ == "__main__":
+    main()
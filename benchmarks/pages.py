@@ -0,0 +1,83 @@
+"""
+Page loading for the benchmarks.
+
+Pass saved Play Store pages (``curl -o page.html <url>``) on the command line
+to benchmark against real markup. Without them a synthetic detail page of
+comparable size is generated: ~1.5MB of HTML holding a few dozen
+AF_initDataCallback blocks around a large ``ds:5`` payload.
+"""
+
+import json
+import random
+import sys
+from typing import List
+
+
+def _noise(rng: random.Random, depth: int = 0):
+    roll = rng.random()
+    if depth > 2 or roll < 0.4:
+        return rng.choice([None, rng.randint(0, 10**9), "x" * rng.randint(1, 30)])
+    return [_noise(rng, depth + 1) for _ in range(rng.randint(1, 5))]
+
+
+def synthetic_detail_page(seed: int = 0, blocks: int = 30) -> str:
+    rng = random.Random(seed)
+
+    detail = [_noise(rng) for _ in range(150)]
+    detail[0] = ["Synthetic title"]
+    detail[9] = ["Everyone", None, [None, "Mild violence"]]
+    detail[12] = [[[None, "Description line &amp; more<br>" * 150]]]
+    detail[13] = ["1,000,000+", 1000000, 1234567]
+    detail[51] = [
+        [None, 4.5],
+        [None] + [[None, i * 1000] for i in range(1, 6)],
+        [None, 15000],
+        [None, 900],
+    ]
+    detail[57] = [[[[[None, [[0, "USD"]]]]]]]
+    detail[68] = ["Developer", [None, None, None, None, [None, None, "?id=Developer"]]]
+    detail[73] = [[None, "Summary &amp; more"]]
+    detail[78] = [
+        [[None, None, None, [None, None, "https://img/%d" % i]] for i in range(24)]
+    ]
+    detail[79] = [[["Puzzle", None, "GAME_PUZZLE"]]]
+    detail[118] = [
+        [[["Puzzle", None, "GAME_PUZZLE", None]], [["Casual", None, "C", None]]]
+    ]
+    detail[140] = [[["1.2.3"]]]
+    detail[145] = [["Jan 1, 2024", [1704067200]]]
+
+    datasets = {
+        "ds:5": [None, [None, None, detail]],
+        "ds:8": [[[None, None, None, None, "comment %d" % i] for i in range(40)]],
+    }
+    for i in range(blocks):
+        datasets.setdefault(
+            "ds:{}".format(i), [[_noise(rng) for _ in range(rng.randint(10, 150))]]
+        )
+
+    html = ["<!doctype html><html><head><style>", "a{color:red}" * 20000, "</style>"]
+    for key, value in datasets.items():
+        html.append(
+            '<script class="{0}" nonce="n">AF_initDataCallback({{key: \'{0}\', '
+            "hash: '{1}', data:{2}, sideChannel: {{}}}});</script>".format(
+                key, rng.randint(1, 99), json.dumps(value)
+            )
+        )
+    html.append("<script>var s = '" + "y" * 200000 + "';</script></head><body>")
+    html.append("<div class='c'>text</div>" * 20000)
+    html.append("</body></html>")
+
+    return "".join(html)
+
+
+def load_pages(paths: List[str] = None) -> List[str]:
+    paths = sys.argv[1:] if paths is None else paths
+    if paths:
+        pages = []
+        for path in paths:
+            with open(path, encoding="UTF-8") as f:
+                pages.append(f.read())
+        return pages
+
+    return [synthetic_detail_page(seed) for seed in range(3)]
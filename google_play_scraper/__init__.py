@@ -1,5 +1,26 @@
-from .constants.google_play import Sort, Device  # noqa: F401
-from .features.app import app  # noqa: F401
-from .features.permissions import permissions  # noqa: F401
-from .features.reviews import reviews, reviews_all  # noqa: F401
-from .features.search import search  # noqa: F401
+from .changes import ChangeType, ReviewChange, ReviewChangeTracker  # noqa: F401
+from .constants.google_play import Sort, Device, Priority  # noqa: F401
+from .features.app import app, app_async  # noqa: F401
+from .features.permissions import (  # noqa: F401
+    permissions,
+    permissions_async,
+    permissions_batch,
+)
+from .features.reviews import (  # noqa: F401
+    Review,
+    SyncCheckpoint,
+    reviews,
+    reviews_all,
+    reviews_all_async,
+    reviews_all_checkpointed,
+    reviews_all_frame,
+    reviews_all_locales,
+    reviews_async,
+    reviews_batch,
+    reviews_frame,
+    reviews_iter,
+    reviews_iter_async,
+    reviews_since,
+)
+from .features.search import search, search_async  # noqa: F401
+from .store import ReviewStore  # noqa: F401
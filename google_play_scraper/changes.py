@@ -0,0 +1,80 @@
+from datetime import datetime
+from enum import Enum
+from hashlib import blake2b
+from typing import Iterable, Iterator, Mapping, MutableMapping, NamedTuple, Optional
+
+# Fields whose change makes a review "updated". thumbsUpCount is left out:
+# it moves all the time and would turn every crawl into a flood of updates.
+_CONTENT_FIELDS = ("userName", "content", "score", "at", "reviewCreatedVersion")
+_REPLY_FIELDS = ("replyContent", "repliedAt")
+_DIGEST_SIZE = 8
+
+
+class ChangeType(str, Enum):
+    INSERTED = "inserted"
+    UPDATED = "updated"
+    REPLY_ADDED = "reply_added"
+
+
+class ReviewChange(NamedTuple):
+    type: ChangeType
+    review: Mapping
+
+
+def _value(review: Mapping, field: str):
+    value = review[field]
+    # Timestamps are naive local datetimes, whose repr changes with the
+    # timezone; the epoch seconds do not.
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    return value
+
+
+def _digest(review: Mapping, fields: tuple) -> bytes:
+    return blake2b(
+        "\x1f".join(repr(_value(review, field)) for field in fields).encode("UTF-8"),
+        digest_size=_DIGEST_SIZE,
+    ).digest()
+
+
+class ReviewChangeTracker:
+    """
+    Turns a stream of reviews into change events. For every ``reviewId`` only
+    a 16-byte digest is kept: 8 bytes over the review itself and 8 over the
+    developer reply. ``hashes`` can be any mutable mapping of str to bytes,
+    e.g. a ``dbm`` database, to carry the digests from one run to the next.
+    """
+
+    def __init__(self, hashes: Optional[MutableMapping[str, bytes]] = None):
+        self.hashes = {} if hashes is None else hashes
+
+    def changes(self, reviews: Iterable[Mapping]) -> Iterator[ReviewChange]:
+        """
+        Yield an event for every review that is new or changed since it was
+        last seen, lazily, so it can sit on top of ``reviews_iter()``.
+        """
+        for review in reviews:
+            change = self.track(review)
+            if change is not None:
+                yield change
+
+    def track(self, review: Mapping) -> Optional[ReviewChange]:
+        content = _digest(review, _CONTENT_FIELDS)
+        reply = (
+            b"\0" * _DIGEST_SIZE
+            if review["replyContent"] is None
+            else _digest(review, _REPLY_FIELDS)
+        )
+
+        previous = self.hashes.get(review["reviewId"])
+        if previous == content + reply:
+            return None
+        self.hashes[review["reviewId"]] = content + reply
+
+        if previous is None:
+            return ReviewChange(ChangeType.INSERTED, review)
+        if previous[:_DIGEST_SIZE] == content and previous[_DIGEST_SIZE:] == (
+            b"\0" * _DIGEST_SIZE
+        ):
+            return ReviewChange(ChangeType.REPLY_ADDED, review)
+        return ReviewChange(ChangeType.UPDATED, review)
@@ -1,9 +1,15 @@
+from collections.abc import Mapping
 from datetime import datetime
-from typing import Any, Callable, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from google_play_scraper.utils import nested_lookup
 from google_play_scraper.utils.data_processors import unescape_text
 
+# Marks a path that does not exist in the source (the IndexError/KeyError
+# case of a plain lookup), as opposed to one that resolves to None.
+_MISSING = object()
+
 
 class ElementSpec:
     def __init__(
@@ -17,25 +23,132 @@ class ElementSpec:
         self.data_map = data_map
         self.post_processor = post_processor
         self.fallback_value = fallback_value
+        self._compiled = None
+
+    @property
+    def path(self) -> Tuple:
+        if self.ds_num is None:
+            return tuple(self.data_map)
+        return ("ds:{}".format(self.ds_num),) + tuple(self.data_map)
 
     def extract_content(self, source: dict) -> Any:
-        try:
-            if self.ds_num is None:
-                result = nested_lookup(source, self.data_map)
-            else:
-                result = nested_lookup(
-                    source["ds:{}".format(self.ds_num)], self.data_map
-                )
-
-            if self.post_processor is not None:
-                result = self.post_processor(result)
-        except:
-            if isinstance(self.fallback_value, ElementSpec):
-                result = self.fallback_value.extract_content(source)
-            else:
-                result = self.fallback_value
-
-        return result
+        if self._compiled is None:
+            self._compiled = CompiledSpecs({None: self})
+        return self._compiled.extract(source)[None]
+
+
+def _step(node: Any, key: Any) -> Any:
+    if type(node) is list or type(node) is str:
+        if type(key) is not int:
+            return None
+        if -len(node) <= key < len(node):
+            return node[key]
+        return _MISSING
+    if isinstance(node, Mapping):
+        if key in node:
+            return node[key]
+        return _MISSING
+    if node is _MISSING:
+        return _MISSING
+    # Indexing into None or a scalar yields None, like nested_lookup.
+    return None
+
+
+class CompiledSpecs:
+    """
+    A set of ElementSpecs compiled into one flat extractor.
+
+    The spec paths are merged into a prefix tree whose nodes are numbered so
+    that every parent precedes its children. ``extract`` walks that list once,
+    so prefixes shared by many specs (``ds:5 -> 1 -> 2`` on the detail page)
+    are resolved once per source. Missing paths never raise; they select the
+    fallback chain instead.
+    """
+
+    def __init__(self, specs: Dict[Any, ElementSpec]):
+        node_ids: Dict[Tuple, int] = {(): 0}
+        self._steps: List[Tuple[int, Any]] = []
+        self._names = []
+        self._getters = []
+
+        for name, spec in specs.items():
+            node_id = 0
+            path = ()
+            for key in spec.path:
+                parent_id = node_id
+                path += (key,)
+                node_id = node_ids.get(path)
+                if node_id is None:
+                    node_id = node_ids[path] = len(node_ids)
+                    self._steps.append((parent_id, key))
+
+            self._names.append(name)
+            self._getters.append((node_id, spec.post_processor, spec.fallback_value))
+
+    def extract(self, source: Any) -> Dict[Any, Any]:
+        return dict(zip(self._names, self._values(source)))
+
+    def extract_columns(self, sources: Iterable[Any]) -> Dict[Any, List[Any]]:
+        """
+        Extract every source straight into one list per spec, without
+        building a dict per source.
+        """
+        columns = {name: [] for name in self._names}
+        appends = [columns[name].append for name in self._names]
+
+        for source in sources:
+            for append, value in zip(appends, self._values(source)):
+                append(value)
+
+        return columns
+
+    def _values(self, source: Any) -> List[Any]:
+        nodes = [source]
+        for parent_id, key in self._steps:
+            nodes.append(_step(nodes[parent_id], key))
+
+        values = []
+        for node_id, post_processor, fallback_value in self._getters:
+            value = nodes[node_id]
+            if value is _MISSING:
+                value = _fallback(fallback_value, source)
+            elif post_processor is not None:
+                try:
+                    value = post_processor(value)
+                except Exception:
+                    value = _fallback(fallback_value, source)
+            values.append(value)
+
+        return values
+
+
+def _fallback(fallback_value: Any, source: Any) -> Any:
+    if isinstance(fallback_value, ElementSpec):
+        return fallback_value.extract_content(source)
+    return fallback_value
+
+
+@lru_cache(maxsize=128)
+def _compile_specs(items: Tuple[Tuple[str, ElementSpec], ...]) -> CompiledSpecs:
+    return CompiledSpecs(dict(items))
+
+
+def compile_specs(specs: Dict[str, ElementSpec]) -> CompiledSpecs:
+    return _compile_specs(tuple(specs.items()))
+
+
+def select_specs(
+    specs: Dict[str, ElementSpec], fields: Optional[Iterable[str]]
+) -> Dict[str, ElementSpec]:
+    if fields is None:
+        return specs
+
+    fields = list(fields)
+    unknown = [field for field in fields if field not in specs]
+    if unknown:
+        raise ValueError("Unknown fields: {}".format(", ".join(unknown)))
+
+    return {field: specs[field] for field in fields}
 
 
 def extract_categories(s, categories=None):
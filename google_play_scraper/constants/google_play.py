@@ -7,6 +7,16 @@ class Sort(int, Enum):
     RATING = 3
 
 
+class Priority(int, Enum):
+    """
+    Lane a request is scheduled in. BULK requests only use capacity that
+    INTERACTIVE requests leave over.
+    """
+
+    BULK = 0
+    INTERACTIVE = 1
+
+
 class Device(int, Enum):
     MOBILE = 2
     TABLET = 3
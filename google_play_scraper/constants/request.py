@@ -1,4 +1,7 @@
+import json
 from abc import ABC, abstractmethod
+from typing import List, Tuple
+from urllib.parse import quote
 
 PLAY_STORE_BASE_URL = "https://play.google.com"
 
@@ -43,10 +46,12 @@ class Formats:
         def build(self, lang: str, country: str) -> str:
             return self.URL_FORMAT.format(lang=lang, country=country)
 
-        PAYLOAD_FORMAT_FOR_FIRST_PAGE = "f.req=%5B%5B%5B%22oCPfdb%22%2C%22%5Bnull%2C%5B2%2C{sort}%2C%5B{count}%5D%2Cnull%2C%5Bnull%2C{score}%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2C{device_id}%5D%5D%2C%5B%5C%22{app_id}%5C%22%2C7%5D%5D%22%2Cnull%2C%22generic%22%5D%5D%5D%0A"
-        PAYLOAD_FORMAT_FOR_PAGINATED_PAGE = "f.req=%5B%5B%5B%22oCPfdb%22%2C%22%5Bnull%2C%5B2%2C{sort}%2C%5B{count}%2Cnull%2C%5C%22{pagination_token}%5C%22%5D%2Cnull%2C%5Bnull%2C{score}%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2Cnull%2C{device_id}%5D%5D%2C%5B%5C%22{app_id}%5C%22%2C7%5D%5D%22%2Cnull%2C%22generic%22%5D%5D%5D%0A"
+        RPC_ID = "oCPfdb"
+        REQUEST_ID = "generic"
+        RPC_ARGS_FORMAT_FOR_FIRST_PAGE = '[null,[2,{sort},[{count}],null,[null,{score},null,null,null,null,null,null,{device_id}]],["{app_id}",7]]'
+        RPC_ARGS_FORMAT_FOR_PAGINATED_PAGE = '[null,[2,{sort},[{count},null,"{pagination_token}"],null,[null,{score},null,null,null,null,null,null,{device_id}]],["{app_id}",7]]'
 
-        def build_body(
+        def build_rpc(
             self,
             app_id: str,
             sort: int,
@@ -54,9 +59,9 @@ class Formats:
             filter_score_with: int,
             filter_device_with: int,
             pagination_token: str,
-        ) -> bytes:
+        ) -> Tuple[str, str]:
             if pagination_token is not None:
-                result = self.PAYLOAD_FORMAT_FOR_PAGINATED_PAGE.format(
+                args = self.RPC_ARGS_FORMAT_FOR_PAGINATED_PAGE.format(
                     app_id=app_id,
                     sort=sort,
                     count=count,
@@ -65,14 +70,37 @@ class Formats:
                     pagination_token=pagination_token,
                 )
             else:
-                result = self.PAYLOAD_FORMAT_FOR_FIRST_PAGE.format(
+                args = self.RPC_ARGS_FORMAT_FOR_FIRST_PAGE.format(
                     app_id=app_id,
                     sort=sort,
                     count=count,
                     score=filter_score_with,
                     device_id=filter_device_with,
                 )
-            return result.encode()
+            return self.RPC_ID, args
+
+        def build_body(
+            self,
+            app_id: str,
+            sort: int,
+            count: int,
+            filter_score_with: int,
+            filter_device_with: int,
+            pagination_token: str,
+        ) -> bytes:
+            return Formats.BatchExecute.build_body(
+                [
+                    self.build_rpc(
+                        app_id,
+                        sort,
+                        count,
+                        filter_score_with,
+                        filter_device_with,
+                        pagination_token,
+                    )
+                ],
+                request_ids=[self.REQUEST_ID],
+            )
 
     class _Permissions(Format):
         URL_FORMAT = (
@@ -84,10 +112,42 @@ class Formats:
         def build(self, lang: str, country: str) -> str:
             return self.URL_FORMAT.format(lang=lang, country=country)
 
-        PAYLOAD_FORMAT_FOR_PERMISSION = "f.req=%5B%5B%5B%22xdSrCf%22%2C%22%5B%5Bnull%2C%5B%5C%22{app_id}%5C%22%2C7%5D%2C%5B%5D%5D%5D%22%2Cnull%2C%221%22%5D%5D%5D"
+        RPC_ID = "xdSrCf"
+        REQUEST_ID = "1"
+        RPC_ARGS_FORMAT = '[[null,["{app_id}",7],[]]]'
+
+        def build_rpc(self, app_id: str) -> Tuple[str, str]:
+            return self.RPC_ID, self.RPC_ARGS_FORMAT.format(app_id=app_id)
 
         def build_body(self, app_id: str) -> bytes:
-            result = self.PAYLOAD_FORMAT_FOR_PERMISSION.format(app_id=app_id)
+            return Formats.BatchExecute.build_body(
+                [self.build_rpc(app_id)], request_ids=[self.REQUEST_ID]
+            )
+
+    class _BatchExecute(Format):
+        URL_FORMAT = (
+            "{}/_/PlayStoreUi/data/batchexecute?hl={{lang}}&gl={{country}}".format(
+                PLAY_STORE_BASE_URL
+            )
+        )
+
+        def build(self, lang: str, country: str) -> str:
+            return self.URL_FORMAT.format(lang=lang, country=country)
+
+        def build_body(
+            self, rpcs: List[Tuple[str, str]], request_ids: List[str] = None
+        ) -> bytes:
+            # Each call carries a request id, by default its 1-based position,
+            # which the server echoes back in the matching response frame.
+            if request_ids is None:
+                request_ids = [str(i) for i in range(1, len(rpcs) + 1)]
+            envelope = [
+                [rpc_id, args, None, request_id]
+                for request_id, (rpc_id, args) in zip(request_ids, rpcs)
+            ]
+            result = "f.req={}".format(
+                quote(json.dumps([envelope], separators=(",", ":")))
+            )
 
             return result.encode()
 
@@ -114,3 +174,4 @@ class Formats:
     Reviews = _Reviews()
     Permissions = _Permissions()
     Searchresults = _Searchresults()
+    BatchExecute = _BatchExecute()
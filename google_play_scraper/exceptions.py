@@ -7,4 +7,10 @@ class NotFoundError(GooglePlayScraperException):
 
 
 class ExtraHTTPError(GooglePlayScraperException):
+    def __init__(self, message: str, status: int = None):
+        super().__init__(message)
+        self.status = status
+
+
+class PlayGatewayError(GooglePlayScraperException):
     pass
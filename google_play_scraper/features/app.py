@@ -1,43 +1,70 @@
-import json
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
-from google_play_scraper.constants.element import ElementSpecs
-from google_play_scraper.constants.regex import Regex
+from google_play_scraper.constants.element import (
+    ElementSpecs,
+    compile_specs,
+    select_specs,
+)
+from google_play_scraper.constants.google_play import Priority
 from google_play_scraper.constants.request import Formats
 from google_play_scraper.exceptions import NotFoundError
+from google_play_scraper.utils import async_request
+from google_play_scraper.utils.dom import parse_data_callbacks
 from google_play_scraper.utils.request import get
 
 
-def app(app_id: str, lang: str = "en", country: str = "us") -> Dict[str, Any]:
+def app(
+    app_id: str,
+    lang: str = "en",
+    country: str = "us",
+    fields: Iterable[str] = None,
+    priority: Priority = Priority.INTERACTIVE,
+) -> Dict[str, Any]:
     url = Formats.Detail.build(app_id=app_id, lang=lang, country=country)
 
     try:
-        dom = get(url)
+        dom = get(url, priority)
     except NotFoundError:
         url = Formats.Detail.fallback_build(app_id=app_id, lang=lang)
-        dom = get(url)
-    return parse_dom(dom=dom, app_id=app_id, url=url)
+        dom = get(url, priority)
+    return parse_dom(dom=dom, app_id=app_id, url=url, fields=fields)
 
 
-def parse_dom(dom: str, app_id: str, url: str) -> Dict[str, Any]:
-    matches = Regex.SCRIPT.findall(dom)
+async def app_async(
+    app_id: str,
+    lang: str = "en",
+    country: str = "us",
+    fields: Iterable[str] = None,
+    priority: Priority = Priority.INTERACTIVE,
+) -> Dict[str, Any]:
+    url = Formats.Detail.build(app_id=app_id, lang=lang, country=country)
 
-    dataset = {}
+    try:
+        dom = await async_request.get(url, priority)
+    except NotFoundError:
+        url = Formats.Detail.fallback_build(app_id=app_id, lang=lang)
+        dom = await async_request.get(url, priority)
+    return parse_dom(dom=dom, app_id=app_id, url=url, fields=fields)
 
-    for match in matches:
-        key_match = Regex.KEY.findall(match)
-        value_match = Regex.VALUE.findall(match)
 
-        if key_match and value_match:
-            key = key_match[0]
-            value = json.loads(value_match[0])
+def parse_dom(
+    dom: str, app_id: str, url: str, fields: Iterable[str] = None
+) -> Dict[str, Any]:
+    """
+    Extract app details from a detail page. With ``fields``, only those
+    ElementSpecs are evaluated, so ``ds`` blocks no requested field lives in
+    are never decoded. ``appId`` and ``url`` are always included.
+    """
+    if fields is not None:
+        fields = [field for field in fields if field not in ("appId", "url")]
 
-            dataset[key] = value
+    specs = select_specs(ElementSpecs.Detail, fields)
+    contents = compile_specs(specs).extract(parse_data_callbacks(dom))
 
     result = {}
 
-    for k, spec in ElementSpecs.Detail.items():
-        content = spec.extract_content(dataset)
+    for k, spec in specs.items():
+        content = contents[k]
         if content is None:
             result[k] = spec.fallback_value
         else:
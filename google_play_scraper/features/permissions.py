@@ -1,22 +1,68 @@
-import json
-from typing import Dict
+from typing import Dict, List, Optional
 
 from google_play_scraper.constants.element import ElementSpecs
-from google_play_scraper.constants.regex import Regex
+from google_play_scraper.constants.google_play import Priority
 from google_play_scraper.constants.request import Formats
-from google_play_scraper.utils.request import post
+from google_play_scraper.utils import async_request
+from google_play_scraper.utils.batchexecute import post_batch, post_frames
 
 
-def permissions(app_id: str, lang: str = "en", country: str = "us") -> Dict[str, list]:
-    dom = post(
+def permissions(
+    app_id: str,
+    lang: str = "en",
+    country: str = "us",
+    priority: Priority = Priority.INTERACTIVE,
+) -> Dict[str, list]:
+    frames = post_frames(
         Formats.Permissions.build(lang=lang, country=country),
         Formats.Permissions.build_body(app_id),
         {"content-type": "application/x-www-form-urlencoded"},
+        priority,
     )
 
-    matches = json.loads(Regex.PERMISSIONS.findall(dom)[0])
-    container = json.loads(matches[0][2])
+    return _parse_container(frames[0].payload)
 
+
+async def permissions_async(
+    app_id: str,
+    lang: str = "en",
+    country: str = "us",
+    priority: Priority = Priority.INTERACTIVE,
+) -> Dict[str, list]:
+    frames = await async_request.post_frames(
+        Formats.Permissions.build(lang=lang, country=country),
+        Formats.Permissions.build_body(app_id),
+        {"content-type": "application/x-www-form-urlencoded"},
+        priority,
+    )
+
+    return _parse_container(frames[0].payload)
+
+
+def permissions_batch(
+    app_ids: List[str],
+    lang: str = "en",
+    country: str = "us",
+    priority: Priority = Priority.INTERACTIVE,
+) -> Dict[str, Optional[Dict[str, list]]]:
+    """
+    Look up permissions of many apps with one batchexecute call per
+    ``MAX_BATCH_SIZE`` apps. Apps the store returned nothing for map to None.
+    """
+    payloads = post_batch(
+        lang,
+        country,
+        [Formats.Permissions.build_rpc(app_id) for app_id in app_ids],
+        priority,
+    )
+
+    return {
+        app_id: None if payload is None else _parse_container(payload)
+        for app_id, payload in zip(app_ids, payloads)
+    }
+
+
+def _parse_container(container: list) -> Dict[str, list]:
     result = {}
 
     for permission_items in container:
@@ -27,8 +73,8 @@ def permissions(app_id: str, lang: str = "en", country: str = "us") -> Dict[str,
 
             for permission in permission_items:
                 if permission:
-                    result[
-                        ElementSpecs.PermissionType.extract_content(permission)
-                    ] = ElementSpecs.PermissionList.extract_content(permission)
+                    result[ElementSpecs.PermissionType.extract_content(permission)] = (
+                        ElementSpecs.PermissionList.extract_content(permission)
+                    )
 
     return result
@@ -1,16 +1,26 @@
-import json
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 from urllib.parse import quote
 
-from google_play_scraper.constants.element import ElementSpecs
-from google_play_scraper.constants.regex import Regex
+from google_play_scraper.constants.element import (
+    ElementSpecs,
+    compile_specs,
+    select_specs,
+)
+from google_play_scraper.constants.google_play import Priority
 from google_play_scraper.constants.request import Formats
 from google_play_scraper.exceptions import NotFoundError
+from google_play_scraper.utils import async_request
+from google_play_scraper.utils.dom import parse_data_callbacks
 from google_play_scraper.utils.request import get
 
 
 def search(
-    query: str, n_hits: int = 30, lang: str = "en", country: str = "us"
+    query: str,
+    n_hits: int = 30,
+    lang: str = "en",
+    country: str = "us",
+    fields: Iterable[str] = None,
+    priority: Priority = Priority.INTERACTIVE,
 ) -> List[Dict[str, Any]]:
     if n_hits <= 0:
         return []
@@ -18,24 +28,48 @@ def search(
     query = quote(query)
     url = Formats.Searchresults.build(query=query, lang=lang, country=country)
     try:
-        dom = get(url)
+        dom = get(url, priority)
     except NotFoundError:
         url = Formats.Searchresults.fallback_build(query=query, lang=lang)
-        dom = get(url)
+        dom = get(url, priority)
 
-    matches = Regex.SCRIPT.findall(dom)  # take out script blocks from dom
+    return _parse_search_results(dom, n_hits, fields)
 
-    dataset = {}
 
-    for match in matches:
-        key_match = Regex.KEY.findall(match)
-        value_match = Regex.VALUE.findall(match)
+async def search_async(
+    query: str,
+    n_hits: int = 30,
+    lang: str = "en",
+    country: str = "us",
+    fields: Iterable[str] = None,
+    priority: Priority = Priority.INTERACTIVE,
+) -> List[Dict[str, Any]]:
+    if n_hits <= 0:
+        return []
+
+    query = quote(query)
+    url = Formats.Searchresults.build(query=query, lang=lang, country=country)
+    try:
+        dom = await async_request.get(url, priority)
+    except NotFoundError:
+        url = Formats.Searchresults.fallback_build(query=query, lang=lang)
+        dom = await async_request.get(url, priority)
+
+    return _parse_search_results(dom, n_hits, fields)
+
+
+def _parse_search_results(
+    dom: str, n_hits: int, fields: Iterable[str] = None
+) -> List[Dict[str, Any]]:
+    if fields is not None:
+        fields = list(fields)
 
-        if key_match and value_match:
-            key = key_match[0]
-            value = json.loads(value_match[0])
+    top_result_specs = compile_specs(
+        select_specs(ElementSpecs.SearchResultOnTop, fields)
+    )
+    result_specs = compile_specs(select_specs(ElementSpecs.SearchResult, fields))
 
-            dataset[key] = value
+    dataset = parse_data_callbacks(dom)
 
     try:
         top_result = dataset["ds:4"][0][1][0][23][16]
@@ -55,23 +89,9 @@ def search(
 
     n_apps = min(len(dataset), n_hits)
 
-    search_results = (
-        [
-            {
-                k: spec.extract_content(top_result)
-                for k, spec in ElementSpecs.SearchResultOnTop.items()
-            }
-        ]
-        if top_result
-        else []
-    )
+    search_results = [top_result_specs.extract(top_result)] if top_result else []
 
     for app_idx in range(n_apps - len(search_results)):
-        app = {}
-        for k, spec in ElementSpecs.SearchResult.items():
-            content = spec.extract_content(dataset[app_idx])
-            app[k] = content
-
-        search_results.append(app)
+        search_results.append(result_specs.extract(dataset[app_idx]))
 
     return search_results
@@ -0,0 +1,149 @@
+import sqlite3
+from datetime import datetime
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Union
+
+from google_play_scraper.features.reviews import Review, _timestamp
+
+_COLUMNS = ("appId",) + Review._fields
+# Columns holding epoch seconds; dict reviews carry them as datetimes.
+_TIMESTAMP_COLUMNS = ("at", "repliedAt")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews (
+    reviewId TEXT PRIMARY KEY,
+    appId TEXT NOT NULL,
+    userName TEXT,
+    userImage TEXT,
+    content TEXT,
+    score INTEGER,
+    thumbsUpCount INTEGER,
+    reviewCreatedVersion TEXT,
+    at INTEGER,
+    replyContent TEXT,
+    repliedAt INTEGER,
+    appVersion TEXT
+);
+CREATE INDEX IF NOT EXISTS reviews_app_at ON reviews (appId, at);
+CREATE INDEX IF NOT EXISTS reviews_app_score ON reviews (appId, score);
+CREATE INDEX IF NOT EXISTS reviews_app_version ON reviews (appId, appVersion);
+"""
+
+_UPSERT = "INSERT INTO reviews ({}) VALUES ({}) ON CONFLICT (reviewId) DO UPDATE SET {}".format(
+    ", ".join(_COLUMNS),
+    ", ".join("?" for _ in _COLUMNS),
+    ", ".join(
+        "{0} = excluded.{0}".format(column)
+        for column in _COLUMNS
+        if column != "reviewId"
+    ),
+)
+
+
+def _epoch(value: Any) -> Optional[int]:
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    return value
+
+
+def _row(app_id: str, review: Mapping) -> tuple:
+    if isinstance(review, Review):
+        values = [getattr(review, name) for name in review.__slots__]
+    else:
+        values = [
+            _epoch(review.get(name)) if name in _TIMESTAMP_COLUMNS else review.get(name)
+            for name in Review._fields
+        ]
+
+    return (app_id, *values)
+
+
+class ReviewStore:
+    """
+    Reviews kept in a local SQLite database, one row per ``reviewId`` with
+    indexes on ``(appId, at)``, ``(appId, score)`` and ``(appId, appVersion)``.
+
+    ``upsert`` writes a whole page in one transaction and overwrites reviews
+    seen before, so edited reviews and new replies replace the old row.
+    ``sink`` plugs the store straight into ``reviews_all_checkpointed``; pass
+    ``SQLiteCheckpoint.connection`` and ``commit=False`` to have each page and
+    its checkpoint committed together.
+    """
+
+    def __init__(self, database: Union[str, sqlite3.Connection] = ":memory:"):
+        if isinstance(database, sqlite3.Connection):
+            self.connection = database
+        else:
+            self.connection = sqlite3.connect(database, check_same_thread=False)
+
+        self.connection.executescript(_SCHEMA)
+
+    def upsert(self, app_id: str, reviews: Iterable[Mapping], commit: bool = True):
+        rows = [_row(app_id, review) for review in reviews]
+
+        if commit:
+            with self.connection:
+                self.connection.executemany(_UPSERT, rows)
+        else:
+            self.connection.executemany(_UPSERT, rows)
+
+    def sink(self, app_id: str, commit: bool = True) -> Callable[[list, int], None]:
+        return lambda reviews, page_number=None: self.upsert(app_id, reviews, commit)
+
+    def query(
+        self,
+        app_id: str,
+        since: datetime = None,
+        until: datetime = None,
+        score: int = None,
+        app_version: str = None,
+        limit: int = None,
+        record_type: type = dict,
+    ) -> List[Union[dict, Review]]:
+        """
+        Reviews of ``app_id``, newest first, optionally narrowed to
+        ``since <= at < until``, one score and one app version.
+        """
+        where = ["appId = ?"]
+        params = [app_id]
+
+        if since is not None:
+            where.append("at >= ?")
+            params.append(_epoch(since))
+        if until is not None:
+            where.append("at < ?")
+            params.append(_epoch(until))
+        if score is not None:
+            where.append("score = ?")
+            params.append(score)
+        if app_version is not None:
+            where.append("appVersion = ?")
+            params.append(app_version)
+
+        sql = "SELECT {} FROM reviews WHERE {} ORDER BY at DESC".format(
+            ", ".join(Review._fields), " AND ".join(where)
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        rows = self.connection.execute(sql, params)
+
+        if record_type is Review:
+            return [Review(*row) for row in rows]
+
+        result = []
+        for row in rows:
+            review = dict(zip(Review._fields, row))
+            for name in _TIMESTAMP_COLUMNS:
+                review[name] = _timestamp(review[name])
+            result.append(review)
+
+        return result
+
+    def count(self, app_id: str) -> int:
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM reviews WHERE appId = ?", (app_id,)
+        ).fetchone()[0]
+
+    def close(self):
+        self.connection.close()
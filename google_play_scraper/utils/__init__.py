@@ -1,8 +1,7 @@
 def nested_lookup(source, indexes):
     try:
-        if len(indexes) == 1:
-            return source[indexes[0]]
-
-        return nested_lookup(source[indexes[0]], indexes[1:])
+        for index in indexes:
+            source = source[index]
+        return source
     except TypeError:
         return None
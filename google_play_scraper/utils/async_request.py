@@ -0,0 +1,420 @@
+import asyncio
+import socket
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urlsplit
+
+from google_play_scraper.constants.google_play import Priority
+from google_play_scraper.exceptions import ExtraHTTPError, PlayGatewayError
+from google_play_scraper.utils.batchexecute import (
+    BatchExecuteDecoder,
+    Frame,
+    streaming_url,
+)
+from google_play_scraper.utils.request import (
+    _SSL_CONTEXT,
+    CHUNK_SIZE,
+    DEFAULT_HEADERS,
+    MAX_REDIRECTS,
+    PLAY_GATEWAY_ERROR,
+    POOL_SIZE,
+    TIMEOUT,
+    _Proxy,
+    _limiter,
+    _pools,
+    _proxy_for,
+    _retry_policy,
+    _raise_for_status,
+    _redirect_location,
+    _report_status,
+)
+
+
+class _AsyncConnection:
+    __slots__ = ("reader", "writer", "loop")
+
+    def __init__(self, reader, writer, loop):
+        self.reader = reader
+        self.writer = writer
+        self.loop = loop
+
+    def close(self):
+        self.writer.close()
+
+
+class AsyncConnectionPool:
+    """
+    Keep-alive HTTP/1.1 connection pool on asyncio streams, the asynchronous
+    counterpart of ``utils.request.ConnectionPool``, with the same proxy
+    handling. Connections are only usable on the event loop that opened
+    them, so each loop has its own idle connections.
+    """
+
+    def __init__(
+        self, pool_size: int = POOL_SIZE, timeout: float = TIMEOUT, ssl_context=None
+    ):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.ssl_context = ssl_context or _SSL_CONTEXT
+        self._idle: Dict[
+            asyncio.AbstractEventLoop,
+            Dict[Tuple[str, str, int], List[_AsyncConnection]],
+        ] = {}
+        self._proxies: Dict[Tuple[str, str, int], Optional[_Proxy]] = {}
+
+    def _proxy(self, key: Tuple[str, str, int]) -> Optional[_Proxy]:
+        if key not in self._proxies:
+            self._proxies[key] = _proxy_for(key[0], key[1])
+        return self._proxies[key]
+
+    async def _open_tunnel(self, proxy: _Proxy, host: str, port: int):
+        """
+        Open a TLS connection to ``host`` through a CONNECT tunnel. The
+        handshake is done on the bare socket, which then goes to
+        ``open_connection`` so TLS starts on top of the tunnel.
+        """
+        loop = asyncio.get_running_loop()
+        sock = await loop.run_in_executor(
+            None, socket.create_connection, (proxy.host, proxy.port), self.timeout
+        )
+        try:
+            sock.setblocking(False)
+            head = "CONNECT {0}:{1} HTTP/1.1\r\nHost: {0}:{1}\r\n".format(
+                host, port
+            ) + "".join("{}: {}\r\n".format(k, v) for k, v in proxy.headers.items())
+            await loop.sock_sendall(sock, (head + "\r\n").encode("latin-1"))
+
+            # The proxy sends nothing after its headers until the TLS
+            # handshake starts, so reading up to the blank line is safe.
+            response = b""
+            while b"\r\n\r\n" not in response:
+                chunk = await loop.sock_recv(sock, CHUNK_SIZE)
+                if not chunk:
+                    raise OSError("Tunnel connection closed by proxy")
+                response += chunk
+
+            status_line = response.split(b"\r\n", 1)[0].decode("latin-1")
+            status = status_line.split(None, 2)[1:2]
+            if status != ["200"]:
+                raise OSError("Tunnel connection failed: {}".format(status_line))
+
+            return await asyncio.open_connection(
+                sock=sock, ssl=self.ssl_context, server_hostname=host
+            )
+        except BaseException:
+            sock.close()
+            raise
+
+    def _idle_on(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> Dict[Tuple[str, str, int], List[_AsyncConnection]]:
+        # A finished loop cannot close its connections any more; once they
+        # are dropped their transports close the sockets when collected.
+        for other in list(self._idle):
+            if other.is_closed():
+                self._idle.pop(other, None)
+        return self._idle.setdefault(loop, {})
+
+    async def _checkout(self, key) -> Tuple[_AsyncConnection, bool]:
+        loop = asyncio.get_running_loop()
+        idle = self._idle_on(loop).get(key)
+        while idle:
+            conn = idle.pop()
+            if not conn.reader.at_eof():
+                return conn, True
+            conn.close()
+
+        scheme, host, port = key
+        proxy = self._proxy(key)
+        if proxy is None:
+            connect = asyncio.open_connection(
+                host,
+                port,
+                ssl=self.ssl_context if scheme == "https" else None,
+                server_hostname=host if scheme == "https" else None,
+            )
+        elif scheme == "https":
+            connect = self._open_tunnel(proxy, host, port)
+        else:
+            connect = asyncio.open_connection(proxy.host, proxy.port)
+        reader, writer = await asyncio.wait_for(connect, self.timeout)
+        return _AsyncConnection(reader, writer, loop), False
+
+    def _checkin(self, key, conn: _AsyncConnection):
+        idle = self._idle_on(conn.loop).setdefault(key, [])
+        if len(idle) < self.pool_size:
+            idle.append(conn)
+        else:
+            conn.close()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes = None,
+        headers: dict = None,
+        sink: Callable[[bytes], None] = None,
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Send a request and return (status, headers, body). When ``sink`` is
+        given, a successful response body is handed to it chunk by chunk as it
+        arrives instead of being returned.
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        _headers = dict(DEFAULT_HEADERS)
+        _headers.update(headers or {})
+        _headers["Host"] = parts.netloc
+        _headers["Accept-Encoding"] = "identity"
+
+        proxy = self._proxy(key)
+        if proxy is not None and scheme == "http":
+            path = "http://{}{}".format(parts.netloc, path)
+            _headers.update(proxy.headers)
+        if body is not None:
+            _headers["Content-Length"] = str(len(body))
+
+        head = "{} {} HTTP/1.1\r\n".format(method, path) + "".join(
+            "{}: {}\r\n".format(k, v) for k, v in _headers.items()
+        )
+        payload = (head + "\r\n").encode("latin-1") + (body or b"")
+
+        streamed = False
+
+        def deliver(chunk: bytes):
+            nonlocal streamed
+            streamed = True
+            sink(chunk)
+
+        while True:
+            conn, reused = await self._checkout(key)
+            try:
+                conn.writer.write(payload)
+                await asyncio.wait_for(conn.writer.drain(), self.timeout)
+                status, resp_headers, data, keep_alive = await asyncio.wait_for(
+                    self._read_response(conn.reader, None if sink is None else deliver),
+                    self.timeout,
+                )
+            except (asyncio.IncompleteReadError, asyncio.TimeoutError, OSError):
+                conn.close()
+                # Same stale keep-alive handling as the blocking pool.
+                if reused and not streamed:
+                    continue
+                raise
+
+            if keep_alive:
+                self._checkin(key, conn)
+            else:
+                conn.close()
+
+            return status, resp_headers, data
+
+    @staticmethod
+    async def _read_exactly(
+        reader: asyncio.StreamReader, size: int, sink: Callable[[bytes], None]
+    ):
+        while size:
+            chunk = await reader.readexactly(min(size, CHUNK_SIZE))
+            sink(chunk)
+            size -= len(chunk)
+
+    @classmethod
+    async def _read_response(
+        cls, reader: asyncio.StreamReader, sink: Callable[[bytes], None] = None
+    ):
+        while True:
+            status_line = await reader.readline()
+            if not status_line:
+                raise asyncio.IncompleteReadError(b"", None)
+            version, status = status_line.split(None, 2)[:2]
+            status = int(status)
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            # Skip interim responses such as 100 Continue.
+            if status >= 200:
+                break
+
+        chunks = []
+        if sink is None or not 200 <= status < 300:
+            sink = chunks.append
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                await cls._read_exactly(reader, size, sink)
+                await reader.readexactly(2)
+        elif "content-length" in headers:
+            await cls._read_exactly(reader, int(headers["content-length"]), sink)
+        else:
+            chunk = await reader.read(CHUNK_SIZE)
+            while chunk:
+                sink(chunk)
+                chunk = await reader.read(CHUNK_SIZE)
+
+        data = b"".join(chunks)
+
+        framed = (
+            "chunked" in headers.get("transfer-encoding", "").lower()
+            or "content-length" in headers
+        )
+        keep_alive = (
+            framed
+            and version == b"HTTP/1.1"
+            and headers.get("connection", "").lower() != "close"
+        )
+
+        return status, headers, data, keep_alive
+
+    def clear(self):
+        idle, self._idle = self._idle, {}
+        self._proxies = {}
+        for loop, conns_by_key in idle.items():
+            if loop.is_closed():
+                continue
+            for conns in conns_by_key.values():
+                for conn in conns:
+                    conn.close()
+
+
+_pool = AsyncConnectionPool()
+_pools.append(_pool)
+
+
+async def _urlopen(
+    url: str,
+    data: Optional[bytes] = None,
+    headers: dict = None,
+    priority: Priority = Priority.INTERACTIVE,
+):
+    return (await _urlopen_bytes(url, data, headers, priority)).decode("UTF-8")
+
+
+T = TypeVar("T")
+
+
+async def _off_loop(function: Callable[..., T], *args) -> T:
+    # Keep a store that may wait on other processes off the event loop.
+    if not _limiter.store.blocking:
+        return function(*args)
+    return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+
+async def _acquire(host: str, priority: Priority):
+    delay = await _off_loop(_limiter.reserve, host, priority)
+    while delay > 0:
+        await asyncio.sleep(delay)
+        if priority != Priority.BULK:
+            break
+        delay = await _off_loop(_limiter.reserve, host, priority)
+
+
+async def _urlopen_bytes(
+    url: str,
+    data: Optional[bytes] = None,
+    headers: dict = None,
+    priority: Priority = Priority.INTERACTIVE,
+    sink: Callable[[bytes], None] = None,
+) -> bytes:
+    method = "GET" if data is None else "POST"
+
+    for _ in range(MAX_REDIRECTS + 1):
+        host = urlsplit(url).hostname
+        await _acquire(host, priority)
+        status, resp_headers, body = await _pool.request(
+            method, url, data, headers, sink
+        )
+        await _off_loop(_report_status, host, status, resp_headers)
+
+        location = _redirect_location(url, status, resp_headers)
+        if location is not None:
+            url = location
+            if status not in (307, 308):
+                method, data = "GET", None
+            continue
+
+        _raise_for_status(status)
+
+        return body
+
+    raise ExtraHTTPError("Too many redirects.")
+
+
+async def _with_retries(send: Callable[[], Awaitable[T]], url: str) -> T:
+    _retry_policy.started()
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            return await send()
+        except Exception as e:
+            if isinstance(e, PlayGatewayError):
+                await _off_loop(_limiter.throttled, urlsplit(url).hostname)
+            if not _retry_policy.should_retry(e, attempt):
+                e.attempts = attempt
+                raise
+        await asyncio.sleep(_retry_policy.delay(attempt))
+
+
+async def post(
+    url: str,
+    data: Union[str, bytes],
+    headers: dict,
+    priority: Priority = Priority.INTERACTIVE,
+) -> str:
+    if isinstance(data, str):
+        data = data.encode()
+
+    async def send() -> str:
+        resp = await _urlopen(url, data, headers, priority)
+        if PLAY_GATEWAY_ERROR in resp:
+            raise PlayGatewayError(PLAY_GATEWAY_ERROR)
+        return resp
+
+    return await _with_retries(send, url)
+
+
+async def post_frames(
+    url: str, data: bytes, headers: dict, priority: Priority = Priority.INTERACTIVE
+) -> List[Frame]:
+    async def send() -> List[Frame]:
+        decoder = BatchExecuteDecoder()
+        frames = []
+        await _urlopen_bytes(
+            streaming_url(url),
+            data,
+            headers,
+            priority,
+            sink=lambda chunk: frames.extend(decoder.feed(chunk)),
+        )
+        return frames + decoder.close()
+
+    return await _with_retries(send, url)
+
+
+async def get(url: str, priority: Priority = Priority.INTERACTIVE) -> str:
+    return await _with_retries(lambda: _urlopen(url, priority=priority), url)
@@ -0,0 +1,205 @@
+import codecs
+import re
+from typing import Any, List, NamedTuple, Optional, Tuple, Union
+
+from google_play_scraper.constants.google_play import Priority
+from google_play_scraper.constants.request import Formats
+from google_play_scraper.exceptions import PlayGatewayError
+from google_play_scraper.utils.json_backend import loads, raw_decode
+from google_play_scraper.utils.request import (
+    PLAY_GATEWAY_ERROR,
+    _urlopen,
+    _with_retries,
+)
+
+MAX_BATCH_SIZE = 50
+
+_PREFIX = b")]}'"
+_PLAY_GATEWAY_ERROR = PLAY_GATEWAY_ERROR.encode()
+_LENGTH = re.compile(rb"\s*(\d+)\n")
+_WHITESPACE = re.compile(r"\s*")
+# Retry decoding an incomplete frame only after the buffer grew by this much.
+_REDECODE_GROWTH = 1.1
+
+
+class Frame(NamedTuple):
+    rpc_id: str
+    request_id: Optional[str]
+    payload: Any
+
+
+class BatchExecuteDecoder:
+    """
+    Incremental decoder for batchexecute responses.
+
+    Bytes are pushed in with ``feed()`` as they arrive. With ``rt=c`` the body
+    is a sequence of length-prefixed chunks, each decoded as soon as it is
+    complete; the plain single-envelope body is decoded on ``close()``. Every
+    ``wrb.fr`` entry becomes a ``Frame`` whose embedded payload string is
+    JSON-decoded exactly once.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._pos = 0
+        self._prefix_seen = False
+        self._length = None
+        self._frame_start = 0
+        self._attempted = 0
+
+    def feed(self, data: bytes) -> List[Frame]:
+        self._buffer += data
+        return self._drain(final=False)
+
+    def close(self) -> List[Frame]:
+        return self._drain(final=True)
+
+    def _drain(self, final: bool) -> List[Frame]:
+        frames = []
+
+        if not self._prefix_seen:
+            if len(self._buffer) < len(_PREFIX) and not final:
+                return frames
+            if self._buffer.startswith(_PREFIX):
+                self._pos = len(_PREFIX)
+            self._prefix_seen = True
+
+        while True:
+            if self._length is None:
+                match = _LENGTH.match(self._buffer, self._pos)
+                if match is None:
+                    if final:
+                        frames += self._decode_envelope()
+                    break
+                self._length = int(match.group(1))
+                self._frame_start = match.end()
+                self._attempted = 0
+
+            frame = self._decode_chunk(final)
+            if frame is None:
+                break
+            frames += frame
+
+        # Drop consumed bytes so the buffer only holds the pending chunk.
+        if self._pos:
+            del self._buffer[: self._pos]
+            self._frame_start -= self._pos
+            self._pos = 0
+
+        return frames
+
+    def _decode_chunk(self, final: bool) -> Optional[List[Frame]]:
+        available = len(self._buffer) - self._frame_start
+        # The length never exceeds the chunk's size in bytes, whichever unit
+        # the server counted it in, so nothing can be complete before that.
+        if not final and (
+            available < self._length or available < self._attempted * _REDECODE_GROWTH
+        ):
+            return None
+        self._attempted = available
+
+        text, _ = codecs.utf_8_decode(
+            bytes(self._buffer[self._frame_start :]), "strict", final
+        )
+        start = _WHITESPACE.match(text).end()
+        try:
+            entries, end = raw_decode(text, start)
+        except ValueError:
+            if final:
+                raise
+            return None
+
+        frame_end = self._frame_start + len(text[:end].encode("UTF-8"))
+        gateway_error = (
+            self._buffer.find(_PLAY_GATEWAY_ERROR, self._frame_start, frame_end) != -1
+        )
+        self._pos = frame_end
+        self._length = None
+
+        return _frames_from_entries(entries, gateway_error)
+
+    def _decode_envelope(self) -> List[Frame]:
+        text = self._buffer[self._pos :].decode("UTF-8")
+        self._pos = len(self._buffer)
+        if not text.strip():
+            return []
+
+        return _frames_from_entries(loads(text), PLAY_GATEWAY_ERROR in text)
+
+
+def _frames_from_entries(entries: list, gateway_error: bool) -> List[Frame]:
+    if gateway_error:
+        raise PlayGatewayError(PLAY_GATEWAY_ERROR)
+
+    return [
+        Frame(
+            entry[1],
+            entry[6] if len(entry) > 6 else None,
+            None if entry[2] is None else loads(entry[2]),
+        )
+        for entry in entries
+        if entry and entry[0] == "wrb.fr"
+    ]
+
+
+def decode_frames(body: Union[str, bytes]) -> List[Frame]:
+    if isinstance(body, str):
+        body = body.encode("UTF-8")
+
+    decoder = BatchExecuteDecoder()
+    return decoder.feed(body) + decoder.close()
+
+
+def streaming_url(url: str) -> str:
+    return url + ("&" if "?" in url else "?") + "rt=c"
+
+
+def post_frames(
+    url: str, data: bytes, headers: dict, priority: Priority = Priority.INTERACTIVE
+) -> List[Frame]:
+    """
+    POST a batchexecute request and decode the response while it streams in.
+    """
+
+    def send() -> List[Frame]:
+        decoder = BatchExecuteDecoder()
+        frames = []
+        _urlopen(
+            streaming_url(url),
+            data,
+            headers,
+            sink=lambda chunk: frames.extend(decoder.feed(chunk)),
+            priority=priority,
+        )
+        return frames + decoder.close()
+
+    return _with_retries(send, url)
+
+
+def post_batch(
+    lang: str,
+    country: str,
+    rpcs: List[Tuple[str, str]],
+    priority: Priority = Priority.INTERACTIVE,
+) -> List[Any]:
+    """
+    Send ``(rpc_id, args)`` calls packed into as few batchexecute POSTs as
+    possible and return their decoded payloads in the order the calls were
+    given. Failed calls come back as None.
+    """
+    url = Formats.BatchExecute.build(lang=lang, country=country)
+
+    payloads = []
+
+    for offset in range(0, len(rpcs), MAX_BATCH_SIZE):
+        chunk = rpcs[offset : offset + MAX_BATCH_SIZE]
+        frames = post_frames(
+            url,
+            Formats.BatchExecute.build_body(chunk),
+            {"content-type": "application/x-www-form-urlencoded"},
+            priority,
+        )
+        routed = {frame.request_id: frame.payload for frame in frames}
+        payloads += [routed.get(str(i)) for i in range(1, len(chunk) + 1)]
+
+    return payloads
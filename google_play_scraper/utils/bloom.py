@@ -0,0 +1,157 @@
+"""
+Persistent set membership for review IDs that do not fit in memory.
+"""
+
+import math
+import mmap
+import os
+import struct
+from hashlib import blake2b
+from typing import List
+
+_MAGIC = b"GPSBLOOM"
+# magic, capacity, count, number of bits, number of hashes
+_HEADER = struct.Struct("<8sQQQI")
+# Each new layer gets twice the capacity and half the false-positive rate
+# of the previous one, so the rates of all layers sum to ``error_rate``.
+_GROWTH = 2
+_TIGHTENING = 0.5
+
+
+class _Layer:
+    def __init__(self, path: str, capacity: int = None, error_rate: float = None):
+        if not os.path.exists(path):
+            num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+            num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+            with open(path, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, capacity, 0, num_bits, num_hashes))
+                f.truncate(_HEADER.size + (num_bits + 7) // 8)
+
+        self._file = open(path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+
+        magic, self.capacity, self.count, self.num_bits, self.num_hashes = (
+            _HEADER.unpack_from(self._map)
+        )
+        if magic != _MAGIC:
+            raise ValueError("{} is not a Bloom filter layer".format(path))
+
+    def _positions(self, h1: int, h2: int):
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def contains(self, h1: int, h2: int) -> bool:
+        data = self._map
+        return all(
+            data[_HEADER.size + position // 8] & (1 << position % 8)
+            for position in self._positions(h1, h2)
+        )
+
+    def add(self, h1: int, h2: int):
+        data = self._map
+        for position in self._positions(h1, h2):
+            data[_HEADER.size + position // 8] |= 1 << position % 8
+
+        self.count += 1
+        struct.pack_into("<Q", data, 16, self.count)
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity
+
+    def flush(self):
+        self._map.flush()
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+
+class BloomFilter:
+    """
+    A scalable Bloom filter kept in a directory of memory-mapped layer files,
+    so only the pages of the bit arrays that are touched stay resident.
+
+    Membership is approximate in one direction: an ID that was added is
+    always reported as seen, and an ID that was not is reported as seen with
+    probability at most ``error_rate``. Once a layer holds ``capacity`` IDs a
+    new, larger one is appended on disk; ``capacity`` and ``error_rate`` only
+    apply when the directory is created.
+
+    Keep one filter per app, e.g. ``BloomFilter("seen/" + app_id)``. Not safe
+    for concurrent writers.
+    """
+
+    def __init__(self, path: str, capacity: int = 1_000_000, error_rate: float = 0.001):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.path = path
+        self.capacity = capacity
+        self.error_rate = error_rate
+
+        os.makedirs(path, exist_ok=True)
+
+        self._layers: List[_Layer] = []
+        while os.path.exists(self._layer_path(len(self._layers))):
+            self._layers.append(_Layer(self._layer_path(len(self._layers))))
+        if not self._layers:
+            self._add_layer()
+
+    def _layer_path(self, index: int) -> str:
+        return os.path.join(self.path, "{}.bloom".format(index))
+
+    def _add_layer(self):
+        index = len(self._layers)
+        if index:
+            capacity = self._layers[-1].capacity * _GROWTH
+        else:
+            capacity = self.capacity
+        error_rate = self.error_rate * (1 - _TIGHTENING) * _TIGHTENING**index
+
+        self._layers.append(_Layer(self._layer_path(index), capacity, error_rate))
+
+    @staticmethod
+    def _hashes(key: str):
+        digest = blake2b(key.encode("UTF-8"), digest_size=16).digest()
+        return int.from_bytes(digest[:8], "little"), int.from_bytes(
+            digest[8:], "little"
+        )
+
+    def __contains__(self, key: str) -> bool:
+        h1, h2 = self._hashes(key)
+        return any(layer.contains(h1, h2) for layer in self._layers)
+
+    def __len__(self) -> int:
+        return sum(layer.count for layer in self._layers)
+
+    def add(self, key: str) -> bool:
+        """
+        Add ``key`` and return whether it was (probably) already present.
+        """
+        h1, h2 = self._hashes(key)
+        if any(layer.contains(h1, h2) for layer in self._layers):
+            return True
+
+        if self._layers[-1].full:
+            self._add_layer()
+        self._layers[-1].add(h1, h2)
+
+        return False
+
+    def flush(self):
+        for layer in self._layers:
+            layer.flush()
+
+    def close(self):
+        for layer in self._layers:
+            layer.close()
+        self._layers = []
+
+    def __enter__(self) -> "BloomFilter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,73 @@
+"""
+Durable progress stores for long crawls. ``commit(state, deliver)`` hands a
+page to its consumer through ``deliver`` and then records ``state``;
+``load()`` returns the last recorded state, or None.
+"""
+
+import json
+import os
+import sqlite3
+from typing import Any, Callable, Dict, Optional
+
+
+class FileCheckpoint:
+    """
+    Keeps the state in a JSON file, replaced atomically on every commit. If
+    the process dies after ``deliver`` but before the file is replaced, the
+    same page is delivered again on restart with the same page number, so
+    sinks that key their writes on it see each page exactly once.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path, encoding="UTF-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def commit(self, state: Dict[str, Any], deliver: Callable[[], None]):
+        deliver()
+
+        tmp_path = "{}.tmp".format(self.path)
+        with open(tmp_path, "w", encoding="UTF-8") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+class SQLiteCheckpoint:
+    """
+    Keeps the state in a SQLite table. ``deliver`` runs inside the same
+    transaction as the state update, so a sink that writes through
+    ``connection`` commits each page and the progress together.
+    """
+
+    def __init__(self, path: str, key: str = "default"):
+        self.key = key
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints"
+                " (key TEXT PRIMARY KEY, state TEXT NOT NULL)"
+            )
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        row = self.connection.execute(
+            "SELECT state FROM checkpoints WHERE key = ?", (self.key,)
+        ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def commit(self, state: Dict[str, Any], deliver: Callable[[], None]):
+        with self.connection:
+            deliver()
+            self.connection.execute(
+                "INSERT OR REPLACE INTO checkpoints (key, state) VALUES (?, ?)",
+                (self.key, json.dumps(state)),
+            )
+
+    def close(self):
+        self.connection.close()
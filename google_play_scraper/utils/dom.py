@@ -0,0 +1,75 @@
+from collections.abc import Mapping
+from typing import Any, Iterator, Tuple
+
+from google_play_scraper.constants.regex import Regex
+from google_play_scraper.utils.json_backend import loads, raw_decode
+
+_DATA_END = ", sideChannel: {}});</"
+
+
+def iter_data_callbacks(dom: str) -> Iterator[Tuple[str, Tuple[int, int]]]:
+    """
+    Walk the page once and yield ``(ds_key, (start, end))`` for every
+    ``AF_initDataCallback`` block, where the span locates its ``data`` payload
+    inside ``dom``. No substrings of the page are copied.
+    """
+    pos = 0
+
+    while True:
+        match = Regex.DATA_CALLBACK.search(dom, pos)
+        if match is None:
+            return
+
+        start = match.end()
+        end = dom.find(_DATA_END, start)
+        if end == -1:
+            return
+
+        yield match.group(1), (start, end)
+
+        pos = end + len(_DATA_END)
+
+
+def decode_span(dom: str, span: Tuple[int, int]) -> Any:
+    start, end = span
+    try:
+        return loads(dom[start:end])
+    except ValueError:
+        # The payload itself contained the end marker, so the span stops
+        # short. Let the decoder find the real end of the document.
+        return raw_decode(dom, Regex.WHITESPACE.match(dom, start).end())[0]
+
+
+class LazyDataset(Mapping):
+    """
+    Read-only mapping of ``ds:N`` keys to their payloads. Only the block
+    spans are located up front; a payload is decoded the first time its key
+    is looked up, so blocks no ElementSpec touches are never parsed.
+    """
+
+    __slots__ = ("_dom", "_spans", "_decoded")
+
+    def __init__(self, dom: str):
+        self._dom = dom
+        self._spans = dict(iter_data_callbacks(dom))
+        self._decoded = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._decoded[key]
+        except KeyError:
+            value = self._decoded[key] = decode_span(self._dom, self._spans[key])
+            return value
+
+    def __contains__(self, key) -> bool:
+        return key in self._spans
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._spans)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+
+def parse_data_callbacks(dom: str) -> LazyDataset:
+    return LazyDataset(dom)
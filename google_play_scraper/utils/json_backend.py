@@ -0,0 +1,39 @@
+"""
+The JSON decoder shared by every decode site. It is chosen once at import:
+orjson when installed, then pysimdjson, otherwise the stdlib ``json`` module.
+Every backend raises a ``ValueError`` subclass on malformed input.
+"""
+
+import json
+from typing import Any, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+if orjson is not None:
+    BACKEND = "orjson"
+    loads = orjson.loads
+elif simdjson is not None:
+    BACKEND = "simdjson"
+    loads = simdjson.loads
+else:
+    BACKEND = "json"
+    loads = json.loads
+
+_decoder = json.JSONDecoder()
+
+
+def raw_decode(s: str, idx: int = 0) -> Tuple[Any, int]:
+    """
+    Decode the JSON document starting at ``idx`` and return it with the index
+    where it ends. None of the fast backends can stop at the end of a
+    document, so this always uses the stdlib.
+    """
+    return _decoder.raw_decode(s, idx)
@@ -0,0 +1,250 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Optional, TypeVar
+
+from google_play_scraper.constants.google_play import Priority
+
+INITIAL_RATE = 10.0
+MIN_RATE = 0.2
+MAX_RATE = 100.0
+BURST = 10
+# Requests per second added for every second of unthrottled traffic.
+RATE_INCREASE = 1.0
+RATE_DECREASE = 0.5
+# Throttling signals this soon after a cut come from requests already in
+# flight when it happened.
+DECREASE_INTERVAL = 1.0
+
+
+T = TypeVar("T")
+
+
+class _Bucket:
+    __slots__ = ("rate", "tokens", "updated_at", "decreased_at")
+
+    def __init__(
+        self,
+        rate: float,
+        tokens: float,
+        updated_at: float,
+        decreased_at: float = float("-inf"),
+    ):
+        self.rate = rate
+        self.tokens = tokens
+        self.updated_at = updated_at
+        self.decreased_at = decreased_at
+
+
+class MemoryBucketStore:
+    """
+    Buckets of this process only.
+    """
+
+    clock = staticmethod(time.monotonic)
+    # Whether ``update`` may block, e.g. on a lock held by another process.
+    blocking = False
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, _Bucket] = {}
+
+    def update(
+        self, host: str, new: Callable[[], _Bucket], update: Callable[[_Bucket], T]
+    ) -> T:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = new()
+            return update(bucket)
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+class SQLiteBucketStore:
+    """
+    Buckets in a SQLite file shared by every process that opens it, so
+    workers on one machine draw from one budget instead of each assuming
+    it has the whole quota. Each update is a ``BEGIN IMMEDIATE``
+    transaction, which serializes them across processes. Wall-clock time is
+    used because monotonic clocks are not comparable between processes.
+    """
+
+    clock = staticmethod(time.time)
+    blocking = True
+
+    def __init__(self, path: str, timeout: float = 30):
+        self.path = path
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection inherited through fork must not be used by the child.
+        if self._pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.path,
+                timeout=self.timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS buckets (host TEXT PRIMARY KEY,"
+                " rate REAL, tokens REAL, updated_at REAL, decreased_at REAL)"
+            )
+            self._pid = os.getpid()
+        return self._connection
+
+    def update(
+        self, host: str, new: Callable[[], _Bucket], update: Callable[[_Bucket], T]
+    ) -> T:
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    "SELECT rate, tokens, updated_at, decreased_at"
+                    " FROM buckets WHERE host = ?",
+                    (host,),
+                ).fetchone()
+                bucket = new() if row is None else _Bucket(*row)
+                result = update(bucket)
+                connection.execute(
+                    "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?, ?, ?)",
+                    (
+                        host,
+                        bucket.rate,
+                        bucket.tokens,
+                        bucket.updated_at,
+                        bucket.decreased_at,
+                    ),
+                )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            return result
+
+    def clear(self):
+        with self._lock:
+            self._connect().execute("DELETE FROM buckets")
+
+    def close(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                self._connection.close()
+            self._connection = self._pid = None
+
+
+class RateLimiter:
+    """
+    Per-host token bucket whose refill rate is steered by AIMD: every
+    request that is not throttled raises the rate a little, every throttling
+    signal (HTTP 429/503, ``PlayGatewayError``) halves it. Callers therefore
+    settle just under the highest rate the host tolerates, never above
+    ``max_rate``.
+
+    Tokens are reserved rather than polled, so ``reserve`` returns at once
+    with the delay the caller must wait; that keeps one limiter usable from
+    threads and event loops alike. Buckets live in ``store``; give every
+    process the same ``SQLiteBucketStore`` path to make ``max_rate`` the
+    budget of the whole machine rather than of each process.
+    """
+
+    def __init__(
+        self,
+        rate: float = INITIAL_RATE,
+        burst: int = BURST,
+        min_rate: float = MIN_RATE,
+        max_rate: float = MAX_RATE,
+        increase: float = RATE_INCREASE,
+        decrease: float = RATE_DECREASE,
+        store=None,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.store = MemoryBucketStore() if store is None else store
+
+    def _update(self, host: str, update: Callable[[_Bucket, float], T]) -> T:
+        now = self.store.clock()
+
+        def refill_and_update(bucket: _Bucket) -> T:
+            # A shared bucket may predate this process's max_rate.
+            bucket.rate = min(bucket.rate, self.max_rate)
+            bucket.tokens = min(
+                self.burst,
+                bucket.tokens + max(0.0, now - bucket.updated_at) * bucket.rate,
+            )
+            bucket.updated_at = now
+            return update(bucket, now)
+
+        return self.store.update(
+            host,
+            lambda: _Bucket(min(self.rate, self.max_rate), self.burst, now),
+            refill_and_update,
+        )
+
+    def reserve(self, host: str, priority: Priority = Priority.INTERACTIVE) -> float:
+        """
+        Ask for a token for one request to ``host`` and return how many
+        seconds to wait. An INTERACTIVE request always gets a token, possibly
+        borrowed from the future, and must wait the returned time before it
+        is sent. A BULK request only gets one while the bucket is not in
+        debt; otherwise nothing is taken and it has to ask again after the
+        returned time, by when INTERACTIVE requests may have cut in.
+        """
+
+        def take(bucket: _Bucket, now: float) -> float:
+            if priority == Priority.BULK and bucket.tokens < 1:
+                return (1 - bucket.tokens) / bucket.rate
+
+            bucket.tokens -= 1
+            if bucket.tokens >= 0:
+                return 0.0
+            return -bucket.tokens / bucket.rate
+
+        return self._update(host, take)
+
+    def acquire(self, host: str, priority: Priority = Priority.INTERACTIVE):
+        delay = self.reserve(host, priority)
+        while delay > 0:
+            time.sleep(delay)
+            delay = 0.0 if priority != Priority.BULK else self.reserve(host, priority)
+
+    def succeeded(self, host: str):
+        def increase(bucket: _Bucket, now: float):
+            bucket.rate = min(self.max_rate, bucket.rate + self.increase / bucket.rate)
+
+        self._update(host, increase)
+
+    def throttled(self, host: str, retry_after: Optional[float] = None):
+        """
+        Cut the rate for ``host`` and empty its bucket for ``retry_after``
+        seconds, or one request interval at the new rate. Signals arriving
+        within ``DECREASE_INTERVAL`` (or one interval, if longer) of the last
+        cut are not counted again.
+        """
+
+        def decrease(bucket: _Bucket, now: float):
+            if now - bucket.decreased_at >= max(DECREASE_INTERVAL, 1 / bucket.rate):
+                bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+                bucket.decreased_at = now
+
+            wait = 1 / bucket.rate if retry_after is None else retry_after
+            bucket.tokens = min(bucket.tokens, -wait * bucket.rate)
+
+        self._update(host, decrease)
+
+    def rate_of(self, host: str) -> float:
+        return self._update(host, lambda bucket, now: bucket.rate)
+
+    def reset(self):
+        self.store.clear()
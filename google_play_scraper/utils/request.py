@@ -1,48 +1,362 @@
+import base64
 import ssl
+import threading
 import time
-from typing import Union
-from urllib.error import HTTPError
-from urllib.request import Request, urlopen
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, TypeVar, Union
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import __version__ as urllib_version
+from urllib.request import getproxies, proxy_bypass
 
-from google_play_scraper.exceptions import ExtraHTTPError, NotFoundError
-
-ssl._create_default_https_context = ssl._create_unverified_context
+from google_play_scraper.constants.google_play import Priority
+from google_play_scraper.exceptions import (
+    ExtraHTTPError,
+    NotFoundError,
+    PlayGatewayError,
+)
+from google_play_scraper.utils.rate_limit import (
+    MemoryBucketStore,
+    RateLimiter,
+    SQLiteBucketStore,
+)
+from google_play_scraper.utils.retry import RetryPolicy, RetryStats
 
 MAX_RETRIES = 3
-RATE_LIMIT_DELAY = 5
-
-
-def _urlopen(obj):
-    try:
-        resp = urlopen(obj)
-    except HTTPError as e:
-        if e.code == 404:
-            raise NotFoundError("App not found(404).")
-        else:
-            raise ExtraHTTPError(
-                "App not found. Status code {} returned.".format(e.code)
+POOL_SIZE = 10
+TIMEOUT = 30
+MAX_REDIRECTS = 5
+CHUNK_SIZE = 64 * 1024
+
+PLAY_GATEWAY_ERROR = "com.google.play.gateway.proto.PlayGatewayError"
+# Statuses that mean "slow down" rather than "this request is wrong".
+THROTTLE_STATUSES = (429, 503)
+
+DEFAULT_HEADERS = {"User-Agent": "Python-urllib/{}".format(urllib_version)}
+
+# Built once and handed to every pooled HTTPS connection instead of
+# replacing ssl's process-wide default context.
+_SSL_CONTEXT = ssl._create_unverified_context()
+
+
+class _Proxy(NamedTuple):
+    host: str
+    port: int
+    headers: Dict[str, str]
+
+
+def _proxy_for(scheme: str, host: str) -> Optional[_Proxy]:
+    """
+    The proxy urllib would use for a ``scheme`` request to ``host``: taken
+    from the ``*_proxy`` environment variables (or the system settings),
+    unless ``no_proxy`` exempts the host.
+    """
+    proxy = getproxies().get(scheme)
+    if not proxy or proxy_bypass(host):
+        return None
+
+    parts = urlsplit(proxy if "://" in proxy else "http://" + proxy)
+    headers = {}
+    if parts.username is not None:
+        credentials = "{}:{}".format(
+            unquote(parts.username), unquote(parts.password or "")
+        ).encode("UTF-8")
+        headers["Proxy-Authorization"] = "Basic " + base64.b64encode(
+            credentials
+        ).decode("ascii")
+    return _Proxy(parts.hostname, parts.port or 80, headers)
+
+
+class ConnectionPool:
+    """
+    Thread-safe keep-alive pool of ``http.client`` connections keyed by
+    (scheme, host, port). At most ``pool_size`` idle connections are kept per
+    host; extra connections opened under contention are closed after use.
+    Proxies are picked up from the environment like ``urllib`` does, once
+    per host until the pool is cleared: HTTPS goes through a CONNECT tunnel.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = POOL_SIZE,
+        timeout: float = TIMEOUT,
+        ssl_context: ssl.SSLContext = None,
+    ):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.ssl_context = ssl_context or _SSL_CONTEXT
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple[str, str, int], List[HTTPConnection]] = {}
+        self._proxies: Dict[Tuple[str, str, int], Optional[_Proxy]] = {}
+
+    def _proxy(self, key: Tuple[str, str, int]) -> Optional[_Proxy]:
+        if key not in self._proxies:
+            self._proxies[key] = _proxy_for(key[0], key[1])
+        return self._proxies[key]
+
+    def _new_connection(self, key: Tuple[str, str, int]) -> HTTPConnection:
+        scheme, host, port = key
+        proxy = self._proxy(key)
+        connect_host, connect_port = (host, port) if proxy is None else proxy[:2]
+        if scheme == "https":
+            conn = HTTPSConnection(
+                connect_host,
+                connect_port,
+                timeout=self.timeout,
+                context=self.ssl_context,
             )
+            if proxy is not None:
+                conn.set_tunnel(host, port, proxy.headers)
+            return conn
+        return HTTPConnection(connect_host, connect_port, timeout=self.timeout)
+
+    def _checkout(self, key) -> Tuple[HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._new_connection(key), False
+
+    def _checkin(self, key, conn: HTTPConnection):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.pool_size:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes = None,
+        headers: dict = None,
+        sink: Callable[[bytes], None] = None,
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Send a request and return (status, headers, body). When ``sink`` is
+        given, a successful response body is handed to it chunk by chunk as it
+        arrives instead of being returned.
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname, port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        _headers = dict(DEFAULT_HEADERS)
+        _headers.update(headers or {})
+
+        proxy = self._proxy(key)
+        if proxy is not None and scheme == "http":
+            # A plain HTTP proxy takes the absolute URL as request target.
+            path = "http://{}{}".format(parts.netloc, path)
+            _headers.update(proxy.headers)
+
+        while True:
+            conn, reused = self._checkout(key)
+            streamed = False
+            try:
+                conn.request(method, path, body=body, headers=_headers)
+                resp = conn.getresponse()
+                if sink is not None and 200 <= resp.status < 300:
+                    data = b""
+                    chunk = resp.read(CHUNK_SIZE)
+                    while chunk:
+                        streamed = True
+                        sink(chunk)
+                        chunk = resp.read(CHUNK_SIZE)
+                else:
+                    data = resp.read()
+            except (HTTPException, OSError):
+                conn.close()
+                # A keep-alive connection may have been dropped by the server
+                # while idle; retry once on a fresh one.
+                if reused and not streamed:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin(key, conn)
+
+            return resp.status, {k.lower(): v for k, v in resp.getheaders()}, data
+
+    def clear(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+            self._proxies = {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+_pool = ConnectionPool()
+# Pools configure_pool() applies to; utils.async_request registers its own.
+_pools = [_pool]
+
+
+def configure_pool(pool_size: int = None, timeout: float = None):
+    for pool in _pools:
+        if pool_size is not None:
+            pool.pool_size = pool_size
+        if timeout is not None:
+            pool.timeout = timeout
+        pool.clear()
+
+
+_limiter = RateLimiter()
+
 
-    return resp.read().decode("UTF-8")
+def configure_rate_limit(
+    rate: float = None,
+    burst: int = None,
+    min_rate: float = None,
+    max_rate: float = None,
+    shared_path: str = None,
+):
+    """
+    Tune the limiter every request passes through. With ``shared_path`` the
+    buckets are kept in that SQLite file, and all processes configured with
+    the same path share ``max_rate`` requests per second per host. A shared
+    store is never cleared here, since it holds the other processes' state.
+    """
+    if rate is not None:
+        _limiter.rate = rate
+    if burst is not None:
+        _limiter.burst = burst
+    if min_rate is not None:
+        _limiter.min_rate = min_rate
+    if max_rate is not None:
+        _limiter.max_rate = max_rate
+    if shared_path is not None:
+        _limiter.store = SQLiteBucketStore(shared_path)
+    elif isinstance(_limiter.store, MemoryBucketStore):
+        _limiter.reset()
 
 
-def post(url: str, data: Union[str, bytes], headers: dict) -> str:
-    last_exception = None
-    rate_exceeded_count = 0
-    for _ in range(MAX_RETRIES):
+def _retry_after(headers: Dict[str, str]) -> Optional[float]:
+    value = headers.get("retry-after", "")
+    return float(value) if value.isdigit() else None
+
+
+def _report_status(host: str, status: int, headers: Dict[str, str]):
+    if status in THROTTLE_STATUSES:
+        _limiter.throttled(host, _retry_after(headers))
+    else:
+        _limiter.succeeded(host)
+
+
+def _redirect_location(url: str, status: int, headers: Dict[str, str]):
+    if status in (301, 302, 303, 307, 308) and "location" in headers:
+        return urljoin(url, headers["location"])
+    return None
+
+
+def _raise_for_status(status: int):
+    if status == 404:
+        raise NotFoundError("App not found(404).")
+    if status >= 400:
+        raise ExtraHTTPError(
+            "App not found. Status code {} returned.".format(status), status
+        )
+
+
+def _urlopen(
+    url: str,
+    data: Optional[bytes] = None,
+    headers: dict = None,
+    sink: Callable[[bytes], None] = None,
+    priority: Priority = Priority.INTERACTIVE,
+) -> Optional[str]:
+    method = "GET" if data is None else "POST"
+
+    for _ in range(MAX_REDIRECTS + 1):
+        host = urlsplit(url).hostname
+        _limiter.acquire(host, priority)
+        status, resp_headers, body = _pool.request(method, url, data, headers, sink)
+        _report_status(host, status, resp_headers)
+
+        location = _redirect_location(url, status, resp_headers)
+        if location is not None:
+            url = location
+            if status not in (307, 308):
+                method, data = "GET", None
+            continue
+
+        _raise_for_status(status)
+
+        if sink is not None:
+            return None
+        return body.decode("UTF-8")
+
+    raise ExtraHTTPError("Too many redirects.")
+
+
+T = TypeVar("T")
+
+
+_retry_policy = RetryPolicy(max_attempts=MAX_RETRIES)
+
+
+def configure_retries(
+    max_attempts: int = None,
+    base_delay: float = None,
+    max_delay: float = None,
+    budget_ratio: float = None,
+):
+    if max_attempts is not None:
+        _retry_policy.max_attempts = max_attempts
+    if base_delay is not None:
+        _retry_policy.base_delay = base_delay
+    if max_delay is not None:
+        _retry_policy.max_delay = max_delay
+    if budget_ratio is not None:
+        _retry_policy.budget_ratio = budget_ratio
+
+
+def retry_stats() -> RetryStats:
+    return _retry_policy.stats()
+
+
+def _with_retries(send: Callable[[], T], url: str) -> T:
+    _retry_policy.started()
+    attempt = 0
+    while True:
+        attempt += 1
         try:
-            resp = _urlopen(Request(url, data=data, headers=headers))
+            return send()
         except Exception as e:
-            last_exception = e
-            continue
-        if "com.google.play.gateway.proto.PlayGatewayError" in resp:
-            rate_exceeded_count += 1
-            last_exception = Exception("com.google.play.gateway.proto.PlayGatewayError")
-            time.sleep(RATE_LIMIT_DELAY * rate_exceeded_count)
-            continue
+            if isinstance(e, PlayGatewayError):
+                _limiter.throttled(urlsplit(url).hostname)
+            if not _retry_policy.should_retry(e, attempt):
+                e.attempts = attempt
+                raise
+        time.sleep(_retry_policy.delay(attempt))
+
+
+def post(
+    url: str,
+    data: Union[str, bytes],
+    headers: dict,
+    priority: Priority = Priority.INTERACTIVE,
+) -> str:
+    if isinstance(data, str):
+        data = data.encode()
+
+    def send() -> str:
+        resp = _urlopen(url, data, headers, priority=priority)
+        if PLAY_GATEWAY_ERROR in resp:
+            raise PlayGatewayError(PLAY_GATEWAY_ERROR)
         return resp
-    raise last_exception
+
+    return _with_retries(send, url)
 
 
-def get(url: str) -> str:
-    return _urlopen(url)
+def get(url: str, priority: Priority = Priority.INTERACTIVE) -> str:
+    return _with_retries(lambda: _urlopen(url, priority=priority), url)
@@ -0,0 +1,121 @@
+import asyncio
+import random
+import threading
+import time
+from http.client import HTTPException
+from typing import NamedTuple
+
+from google_play_scraper.exceptions import ExtraHTTPError, PlayGatewayError
+
+MAX_ATTEMPTS = 3
+BASE_DELAY = 0.5
+MAX_DELAY = 30.0
+# Every request earns this fraction of a retry; retries spend one each.
+BUDGET_RATIO = 0.2
+# Retries allowed per second regardless of traffic, so a quiet client can
+# still ride out a blip.
+BUDGET_MIN_PER_SECOND = 1.0
+# Most retries the budget can bank.
+BUDGET_CAP = 10.0
+
+_TRANSIENT_ERRORS = (
+    PlayGatewayError,
+    HTTPException,
+    OSError,
+    EOFError,
+    asyncio.TimeoutError,
+)
+
+
+class RetryStats(NamedTuple):
+    calls: int
+    retries: int
+    budget_exhausted: int
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is sent again.
+
+    Only errors that can pass on their own are retried: connection resets
+    and timeouts, ``PlayGatewayError``, and HTTP 429 or 5xx responses.
+    Attempts are spaced with full-jitter exponential backoff, and every
+    retry is paid for from a budget that requests refill by
+    ``budget_ratio``, so during an outage retries add at most that fraction
+    of load instead of multiplying it. The error finally raised carries the
+    number of ``attempts`` made; ``stats()`` totals them for the process.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = MAX_ATTEMPTS,
+        base_delay: float = BASE_DELAY,
+        max_delay: float = MAX_DELAY,
+        budget_ratio: float = BUDGET_RATIO,
+        budget_min_per_second: float = BUDGET_MIN_PER_SECOND,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget_ratio = budget_ratio
+        self.budget_min_per_second = budget_min_per_second
+        self._lock = threading.Lock()
+        self._balance = BUDGET_CAP
+        self._updated_at = time.monotonic()
+        self._calls = 0
+        self._retries = 0
+        self._budget_exhausted = 0
+
+    @staticmethod
+    def retryable(error: Exception) -> bool:
+        if isinstance(error, ExtraHTTPError):
+            return error.status is not None and (
+                error.status == 429 or error.status >= 500
+            )
+        return isinstance(error, _TRANSIENT_ERRORS)
+
+    def delay(self, attempt: int) -> float:
+        """
+        Seconds to wait before retry number ``attempt`` (1 for the first).
+        """
+        return random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        )
+
+    def started(self):
+        with self._lock:
+            self._calls += 1
+            self._balance = min(BUDGET_CAP, self._balance + self.budget_ratio)
+
+    def should_retry(
+        self, error: Exception, attempt: int, max_attempts: int = None
+    ) -> bool:
+        """
+        Whether the call that just failed its ``attempt``-th try goes again.
+        Takes a retry from the budget if so. ``max_attempts`` overrides the
+        policy's limit for callers that retry at a coarser level.
+        """
+        if max_attempts is None:
+            max_attempts = self.max_attempts
+        if attempt >= max_attempts or not self.retryable(error):
+            return False
+
+        with self._lock:
+            now = time.monotonic()
+            self._balance = min(
+                BUDGET_CAP,
+                self._balance + (now - self._updated_at) * self.budget_min_per_second,
+            )
+            self._updated_at = now
+
+            if self._balance < 1:
+                self._budget_exhausted += 1
+                return False
+
+            self._balance -= 1
+            self._retries += 1
+            return True
+
+    def stats(self) -> RetryStats:
+        with self._lock:
+            return RetryStats(self._calls, self._retries, self._budget_exhausted)
@@ -0,0 +1,32 @@
+def raw_review(
+    review_id,
+    score=5,
+    at=1700000000,
+    content="content",
+    thumbs_up=0,
+    reply=None,
+    replied_at=1700000100,
+    version="1.0",
+    user_name="user",
+    user_image=None,
+):
+    """
+    A review item laid out as the reviews RPC returns it.
+    """
+    user = [user_name]
+    if user_image is not None:
+        user.append([None, None, None, [None, None, user_image]])
+
+    return [
+        review_id,
+        user,
+        score,
+        None,
+        content,
+        None if at is None else [at],
+        thumbs_up,
+        None if reply is None else [None, reply, [replied_at]],
+        None,
+        None,
+        version,
+    ]
@@ -138,3 +138,15 @@ class TestApp(TestCase):
         self.assertFalse(res["inAppProductPrice"])
 
         # TODO IAP, inAppProductPrice가 유효한 값인 경우에 대한 테스트
+
+    def test_fields(self):
+        fields = ["score", "ratings", "histogram", "installs", "version"]
+
+        result = app("air.com.Tatsuki.CookieBreaker", fields=fields)
+
+        self.assertListEqual(fields + ["appId", "url"], list(result))
+        self.assertEqual("100,000+", result["installs"])
+        self.assertTrue(3.7 < result["score"] < 4.0)
+
+        with self.assertRaises(ValueError):
+            app("air.com.Tatsuki.CookieBreaker", fields=["unknown"])
@@ -0,0 +1,53 @@
+import asyncio
+from unittest import TestCase
+
+from google_play_scraper import (
+    app_async,
+    permissions_async,
+    reviews_all_async,
+    reviews_async,
+    search_async,
+)
+
+
+class TestAsync(TestCase):
+    def test_app_async(self):
+        result = asyncio.run(app_async("air.com.Tatsuki.CookieBreaker"))
+
+        self.assertEqual("Cookie Breaker!!!", result["title"])
+        self.assertEqual("air.com.Tatsuki.CookieBreaker", result["appId"])
+
+    def test_reviews_async_continuation_token(self):
+        async def fetch():
+            first, token = await reviews_async("com.mojang.minecraftpe", count=50)
+            second, _ = await reviews_async(
+                "com.mojang.minecraftpe", continuation_token=token
+            )
+            return first, second
+
+        first, second = asyncio.run(fetch())
+
+        self.assertEqual(50, len(first))
+        self.assertEqual(50, len(second))
+        self.assertFalse(
+            {r["reviewId"] for r in first} & {r["reviewId"] for r in second}
+        )
+
+    def test_reviews_all_async(self):
+        result = asyncio.run(reviews_all_async("co.kr.uaram.userdeliver_"))
+
+        self.assertTrue(0 < len(result) < 10)
+
+    def test_requests_in_flight_concurrently(self):
+        async def fetch():
+            return await asyncio.gather(
+                app_async("com.mojang.minecraftpe"),
+                permissions_async("example.matharithmetics"),
+                search_async("best Pikachu game", n_hits=3),
+            )
+
+        app_result, permissions_result, search_result = asyncio.run(fetch())
+
+        self.assertEqual("com.mojang.minecraftpe", app_result["appId"])
+        self.assertIn("Other", permissions_result)
+        self.assertEqual(3, len(search_result))
@@ -0,0 +1,106 @@
+import asyncio
+import json
+from unittest import TestCase
+from urllib.parse import unquote
+
+from google_play_scraper.constants.request import Formats
+from google_play_scraper.exceptions import PlayGatewayError
+from google_play_scraper.utils.async_request import AsyncConnectionPool
+from google_play_scraper.utils.batchexecute import BatchExecuteDecoder, decode_frames
+
+PAYLOAD = [[["id-1", ["user"], 5, None, 'Ünïcødé 😀 "quoted"']], None, [None, "TOKEN"]]
+ENTRIES = [["wrb.fr", "oCPfdb", json.dumps(PAYLOAD), None, None, None, "generic"]]
+
+
+def _chunked_body(entries):
+    body = ")]}'\n"
+    for chunk in [entries, [["di", 42], ["af.httprm", 41, "-1", 5]]]:
+        text = "\n" + json.dumps(chunk, ensure_ascii=False).replace("],[", "]\n,[")
+        body += "{}{}\n".format(len(text), text)
+    return body.encode()
+
+
+class TestBatchExecuteDecoder(TestCase):
+    def test_length_prefixed_chunks_split_anywhere(self):
+        body = _chunked_body(ENTRIES)
+
+        for size in (1, 3, 64, len(body)):
+            decoder = BatchExecuteDecoder()
+            frames = []
+            for i in range(0, len(body), size):
+                frames += decoder.feed(body[i : i + size])
+            frames += decoder.close()
+
+            self.assertEqual(1, len(frames))
+            self.assertEqual("oCPfdb", frames[0].rpc_id)
+            self.assertEqual("generic", frames[0].request_id)
+            self.assertEqual(PAYLOAD, frames[0].payload)
+
+    def test_single_envelope_body(self):
+        frames = decode_frames(")]}'\n\n" + json.dumps(ENTRIES + [["di", 42]]))
+
+        self.assertEqual(1, len(frames))
+        self.assertEqual(PAYLOAD, frames[0].payload)
+
+    def test_play_gateway_error(self):
+        entries = [
+            [
+                "wrb.fr",
+                "oCPfdb",
+                None,
+                None,
+                None,
+                [5, None, [["com.google.play.gateway.proto.PlayGatewayError"]]],
+                "generic",
+            ]
+        ]
+
+        with self.assertRaises(PlayGatewayError):
+            decode_frames(_chunked_body(entries))
+
+    def test_async_response_is_decoded_as_it_arrives(self):
+        body = _chunked_body(ENTRIES)
+        head = b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+
+        async def read():
+            reader = asyncio.StreamReader()
+            reader.feed_data(head)
+            decoder = BatchExecuteDecoder()
+            frames = []
+            response = asyncio.ensure_future(
+                AsyncConnectionPool._read_response(
+                    reader, lambda chunk: frames.extend(decoder.feed(chunk))
+                )
+            )
+            # Send the body in two HTTP chunks and check the frame is decoded
+            # before the response is complete.
+            middle = body.index(b"]]") + 10
+            for part in (body[:middle], body[middle:]):
+                reader.feed_data(b"%x\r\n%s\r\n" % (len(part), part))
+                await asyncio.sleep(0)
+            self.assertEqual(1, len(frames))
+            self.assertFalse(response.done())
+
+            reader.feed_data(b"0\r\n\r\n")
+            status, _, data, _ = await response
+            return status, data, frames + decoder.close()
+
+        status, data, frames = asyncio.run(read())
+
+        self.assertEqual(200, status)
+        self.assertEqual(b"", data)
+        self.assertEqual(PAYLOAD, frames[0].payload)
+
+
+class TestBuildBody(TestCase):
+    def test_single_rpc_bodies_keep_their_request_ids(self):
+        reviews = Formats.Reviews.build_body("app", 2, 100, "null", "null", "T=")
+        permissions = Formats.Permissions.build_body("app")
+
+        envelope = json.loads(unquote(reviews.decode()[len("f.req=") :]))
+        self.assertEqual("oCPfdb", envelope[0][0][0])
+        self.assertEqual("generic", envelope[0][0][3])
+        self.assertEqual("T=", json.loads(envelope[0][0][1])[1][2][2])
+
+        envelope = json.loads(unquote(permissions.decode()[len("f.req=") :]))
+        self.assertEqual([[["xdSrCf", '[[null,["app",7],[]]]', None, "1"]]], envelope)
@@ -0,0 +1,33 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from google_play_scraper.utils.bloom import BloomFilter
+
+
+class TestBloomFilter(TestCase):
+    def test_grows_and_persists(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "app")
+
+            with BloomFilter(path, capacity=1000, error_rate=0.01) as seen:
+                added = [seen.add("gp:{}".format(i)) for i in range(5000)]
+
+            self.assertLess(sum(added), 50)
+            self.assertGreater(len(os.listdir(path)), 1)
+
+            with BloomFilter(path) as seen:
+                self.assertEqual(5000 - sum(added), len(seen))
+                self.assertTrue(all("gp:{}".format(i) in seen for i in range(5000)))
+
+                false_positives = sum(
+                    "other:{}".format(i) in seen for i in range(10000)
+                )
+                self.assertLess(false_positives, 100)
+
+    def test_invalid_arguments(self):
+        with TemporaryDirectory() as directory:
+            with self.assertRaises(ValueError):
+                BloomFilter(directory, capacity=0)
+            with self.assertRaises(ValueError):
+                BloomFilter(directory, error_rate=1)
@@ -0,0 +1,75 @@
+import dbm
+import os
+import time
+from tempfile import TemporaryDirectory
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+from google_play_scraper import ChangeType, ReviewChangeTracker
+from google_play_scraper.features.reviews import Review, _extract_reviews
+from tests.e2e_tests.fakes import raw_review
+
+
+def review(review_id, content="content", thumbs_up=0, reply=None, record_type=dict):
+    item = raw_review(review_id, content=content, thumbs_up=thumbs_up, reply=reply)
+    return _extract_reviews([item], record_type)[0]
+
+
+class TestReviewChangeTracker(TestCase):
+    def test_changes(self):
+        tracker = ReviewChangeTracker()
+
+        first = list(tracker.changes([review("a"), review("b")]))
+        second = list(
+            tracker.changes(
+                [
+                    review("a", thumbs_up=10),
+                    review("b", reply="thanks"),
+                    review("c"),
+                ]
+            )
+        )
+        third = list(
+            tracker.changes(
+                [review("a", content="edited"), review("b", reply="thanks")]
+            )
+        )
+
+        self.assertListEqual(
+            [ChangeType.INSERTED, ChangeType.INSERTED], [c.type for c in first]
+        )
+        self.assertListEqual(
+            [("b", ChangeType.REPLY_ADDED), ("c", ChangeType.INSERTED)],
+            [(c.review["reviewId"], c.type) for c in second],
+        )
+        self.assertListEqual(
+            [("a", ChangeType.UPDATED)],
+            [(c.review["reviewId"], c.type) for c in third],
+        )
+
+    def test_records_and_persistent_hashes(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "hashes")
+
+            with dbm.open(path, "c") as hashes:
+                list(ReviewChangeTracker(hashes).changes([review("a")]))
+
+            with dbm.open(path, "c") as hashes:
+                record = review("a", record_type=Review)
+                changes = list(ReviewChangeTracker(hashes).changes([record]))
+
+            self.assertListEqual([], changes)
+
+    @skipUnless(hasattr(time, "tzset"), "needs time.tzset")
+    def test_digest_does_not_depend_on_timezone(self):
+        self.addCleanup(time.tzset)
+        tracker = ReviewChangeTracker()
+
+        with patch.dict(os.environ, {"TZ": "UTC"}):
+            time.tzset()
+            list(tracker.changes([review("a", reply="thanks")]))
+        with patch.dict(os.environ, {"TZ": "Asia/Tokyo"}):
+            time.tzset()
+            changes = list(tracker.changes([review("a", reply="thanks")]))
+
+        self.assertListEqual([], changes)
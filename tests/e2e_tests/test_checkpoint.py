@@ -0,0 +1,65 @@
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from google_play_scraper.exceptions import NotFoundError
+from google_play_scraper.features.reviews import (
+    _ContinuationToken,
+    reviews_all_checkpointed,
+)
+from google_play_scraper.utils.checkpoint import FileCheckpoint, SQLiteCheckpoint
+
+
+class TestCheckpoint(TestCase):
+    def test_token_round_trip(self):
+        token = _ContinuationToken("abc", "ko", "kr", 2, 100, 5, None)
+
+        restored = _ContinuationToken.from_json(token.to_json().encode())
+
+        self.assertDictEqual(token.to_dict(), restored.to_dict())
+
+    def test_file_checkpoint(self):
+        with TemporaryDirectory() as directory:
+            checkpoint = FileCheckpoint(os.path.join(directory, "state.json"))
+            delivered = []
+
+            self.assertIsNone(checkpoint.load())
+            checkpoint.commit({"pages": 1}, lambda: delivered.append(1))
+
+            self.assertListEqual([1], delivered)
+            self.assertDictEqual({"pages": 1}, checkpoint.load())
+            self.assertListEqual(["state.json"], os.listdir(directory))
+
+    def test_sqlite_checkpoint_rolls_back_with_delivery(self):
+        with TemporaryDirectory() as directory:
+            checkpoint = SQLiteCheckpoint(os.path.join(directory, "state.db"))
+            checkpoint.connection.execute("CREATE TABLE pages (n INTEGER)")
+
+            def deliver(n):
+                checkpoint.connection.execute("INSERT INTO pages VALUES (?)", (n,))
+                if n == 2:
+                    raise RuntimeError
+
+            checkpoint.commit({"pages": 1}, lambda: deliver(1))
+            with self.assertRaises(RuntimeError):
+                checkpoint.commit({"pages": 2}, lambda: deliver(2))
+
+            self.assertDictEqual({"pages": 1}, checkpoint.load())
+            self.assertListEqual(
+                [(1,)], checkpoint.connection.execute("SELECT n FROM pages").fetchall()
+            )
+            checkpoint.close()
+
+    def test_failed_crawl_warns_and_stays_open(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "state.json")
+
+            with patch(
+                "google_play_scraper.features.reviews._fetch_review_items",
+                side_effect=NotFoundError,
+            ), self.assertWarns(RuntimeWarning):
+                delivered = reviews_all_checkpointed("app", path, lambda *_: None)
+
+            self.assertEqual(0, delivered)
+            self.assertIsNone(FileCheckpoint(path).load())
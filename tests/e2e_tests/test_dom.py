@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+from google_play_scraper.utils.dom import (
+    LazyDataset,
+    iter_data_callbacks,
+    parse_data_callbacks,
+)
+
+DOM = (
+    "<script class=\"ds:3\" nonce=\"x\">AF_initDataCallback({key: 'ds:3', hash: '1', "
+    'data:[1, ["a, sideChannel"]], sideChannel: {}});</script>'
+    "<script>var unrelated = 1;</script>"
+    "<script class=\"ds:5\" nonce=\"x\">AF_initDataCallback({key: 'ds:5', hash: '2', "
+    'data:[null, {"k": "</script>"}], sideChannel: {}});</script>'
+)
+
+
+class TestDataCallbacks(TestCase):
+    def test_spans_point_into_page(self):
+        spans = list(iter_data_callbacks(DOM))
+
+        self.assertEqual(["ds:3", "ds:5"], [key for key, _ in spans])
+        start, end = spans[0][1]
+        self.assertEqual('[1, ["a, sideChannel"]]', DOM[start:end])
+
+    def test_parse(self):
+        self.assertDictEqual(
+            {"ds:3": [1, ["a, sideChannel"]], "ds:5": [None, {"k": "</script>"}]},
+            dict(parse_data_callbacks(DOM)),
+        )
+
+    def test_blocks_are_decoded_on_first_access(self):
+        dataset = LazyDataset(DOM)
+
+        self.assertEqual(["ds:3", "ds:5"], list(dataset))
+        self.assertDictEqual({}, dataset._decoded)
+
+        self.assertIs(dataset["ds:5"], dataset["ds:5"])
+        self.assertEqual(["ds:5"], list(dataset._decoded))
+
+    def test_payload_containing_end_marker(self):
+        dom = (
+            "AF_initDataCallback({key: 'ds:1', hash: '1', "
+            'data:["x, sideChannel: {}});</"], sideChannel: {}});</script>'
+        )
+
+        self.assertListEqual(["x, sideChannel: {}});</"], LazyDataset(dom)["ds:1"])
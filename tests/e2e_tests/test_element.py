@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+from google_play_scraper.constants.element import ElementSpec, compile_specs
+
+
+class TestCompiledSpecs(TestCase):
+    def test_shared_prefixes_are_resolved_once(self):
+        specs = compile_specs(
+            {
+                "title": ElementSpec(5, [1, 2, 0, 0]),
+                "score": ElementSpec(5, [1, 2, 51, 0, 1]),
+                "ratings": ElementSpec(5, [1, 2, 51, 2, 1]),
+            }
+        )
+
+        self.assertEqual(10, len(specs._steps))
+
+    def test_missing_paths_use_fallback_chain(self):
+        specs = compile_specs(
+            {
+                "present": ElementSpec(None, [0, 1]),
+                "none": ElementSpec(None, [1, 0]),
+                "missing": ElementSpec(None, [0, 5], fallback_value="default"),
+                "chained": ElementSpec(
+                    None, [2, 0], fallback_value=ElementSpec(None, [0, 0])
+                ),
+                "processed": ElementSpec(None, [0, 1], lambda s: s.upper()),
+                "failed": ElementSpec(None, [1], lambda s: s.upper(), "failed"),
+            }
+        )
+
+        self.assertDictEqual(
+            {
+                "present": "b",
+                "none": None,
+                "missing": "default",
+                "chained": "a",
+                "processed": "B",
+                "failed": "failed",
+            },
+            specs.extract([["a", "b"], None]),
+        )
+
+    def test_ds_key_lookup(self):
+        spec = ElementSpec(5, [0], fallback_value="missing")
+
+        self.assertEqual(1, spec.extract_content({"ds:5": [1]}))
+        self.assertEqual("missing", spec.extract_content({"ds:3": [1]}))
@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from google_play_scraper.features.permissions import permissions
+from google_play_scraper.features.permissions import permissions, permissions_batch
 
 
 class TestPermission(TestCase):
@@ -60,3 +60,12 @@ class TestPermission(TestCase):
             },
             result,
         )
+
+    def test_batch_matches_single_requests(self):
+        app_ids = ["com.spotify.music", "example.matharithmetics"]
+
+        result = permissions_batch(app_ids, lang="en", country="us")
+
+        self.assertListEqual(app_ids, list(result))
+        for app_id in app_ids:
+            self.assertDictEqual(permissions(app_id), result[app_id])
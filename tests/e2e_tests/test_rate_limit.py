@@ -0,0 +1,129 @@
+import asyncio
+import os
+import threading
+from multiprocessing import get_context
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from google_play_scraper import Priority
+from google_play_scraper.exceptions import ExtraHTTPError
+from google_play_scraper.utils import async_request, request
+from google_play_scraper.utils.rate_limit import (
+    MemoryBucketStore,
+    RateLimiter,
+    SQLiteBucketStore,
+)
+
+
+def reserve_shared(path):
+    limiter = RateLimiter(rate=0.1, burst=5, store=SQLiteBucketStore(path))
+    return [limiter.reserve("host") for _ in range(5)]
+
+
+class TestRateLimiter(TestCase):
+    def test_token_bucket(self):
+        limiter = RateLimiter(rate=10, burst=3)
+
+        delays = [limiter.reserve("host") for _ in range(5)]
+
+        self.assertListEqual([0.0, 0.0, 0.0], delays[:3])
+        self.assertAlmostEqual(0.1, delays[3], places=2)
+        self.assertAlmostEqual(0.2, delays[4], places=2)
+        self.assertEqual(0.0, limiter.reserve("other host"))
+
+    def test_aimd(self):
+        limiter = RateLimiter(rate=10, min_rate=1, max_rate=12)
+
+        limiter.throttled("host")
+        # Signals from requests already in flight do not cut the rate again.
+        limiter.throttled("host")
+        self.assertEqual(5, limiter.rate_of("host"))
+        self.assertGreater(limiter.reserve("host"), 0)
+
+        for _ in range(100):
+            limiter.succeeded("host")
+        self.assertEqual(12, limiter.rate_of("host"))
+        self.assertEqual(10, limiter.rate_of("other host"))
+
+    def test_priority_lanes(self):
+        limiter = RateLimiter(rate=10, burst=2)
+
+        self.assertEqual(0.0, limiter.reserve("host", Priority.BULK))
+        self.assertEqual(0.0, limiter.reserve("host", Priority.INTERACTIVE))
+
+        # Bulk work waits for a free token without taking one...
+        bulk_delay = limiter.reserve("host", Priority.BULK)
+        self.assertGreater(bulk_delay, 0)
+        self.assertAlmostEqual(
+            bulk_delay, limiter.reserve("host", Priority.BULK), places=2
+        )
+
+        # ...so interactive requests queued meanwhile go first, and bulk work
+        # is pushed back behind them.
+        self.assertAlmostEqual(0.1, limiter.reserve("host"), places=2)
+        self.assertAlmostEqual(0.2, limiter.reserve("host"), places=2)
+        self.assertGreater(limiter.reserve("host", Priority.BULK), bulk_delay)
+
+    def test_throttle_status_slows_down_requests(self):
+        limiter = RateLimiter(rate=10)
+
+        with patch.object(request, "_limiter", limiter), patch.object(
+            request._pool,
+            "request",
+            return_value=(429, {"retry-after": "7"}, b""),
+        ):
+            with self.assertRaises(ExtraHTTPError):
+                request._urlopen("https://play.google.com/")
+
+        self.assertEqual(5, limiter.rate_of("play.google.com"))
+        self.assertGreater(limiter.reserve("play.google.com"), 6)
+
+    def test_shared_across_processes(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "quota.db")
+
+            with get_context("spawn").Pool(4) as pool:
+                delays = sorted(sum(pool.map(reserve_shared, [path] * 4), []))
+
+            limiter = RateLimiter(store=SQLiteBucketStore(path))
+            rate = limiter.rate_of("host")
+            limiter.store.close()
+
+        # 20 requests against one bucket of 5 refilled every 10 seconds: the
+        # last one waits about 150 seconds.
+        self.assertEqual([0.0] * 5, delays[:5])
+        self.assertGreater(delays[-1], 140)
+        self.assertEqual(0.1, rate)
+
+    def test_attaching_keeps_shared_state(self):
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "quota.db")
+            throttled = RateLimiter(store=SQLiteBucketStore(path))
+            throttled.throttled("host")
+
+            with patch.object(request, "_limiter", RateLimiter()):
+                request.configure_rate_limit(shared_path=path)
+                rate = request._limiter.rate_of("host")
+                request._limiter.store.close()
+            throttled.store.close()
+
+        self.assertEqual(5, rate)
+
+    def test_blocking_store_runs_off_the_event_loop(self):
+        threads = []
+
+        class BlockingStore(MemoryBucketStore):
+            blocking = True
+
+            def update(self, *args):
+                threads.append(threading.get_ident())
+                return super().update(*args)
+
+        with patch.object(
+            async_request, "_limiter", RateLimiter(store=BlockingStore())
+        ):
+            asyncio.run(async_request._acquire("host", Priority.INTERACTIVE))
+
+        self.assertEqual(1, len(threads))
+        self.assertNotEqual(threading.get_ident(), threads[0])
@@ -0,0 +1,168 @@
+import asyncio
+import base64
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
+from unittest import TestCase
+from unittest.mock import patch
+
+from google_play_scraper.constants.request import PLAY_STORE_BASE_URL
+from google_play_scraper.utils import async_request
+from google_play_scraper.utils.request import (
+    ConnectionPool,
+    _pool,
+    _Proxy,
+    _proxy_for,
+    configure_pool,
+    get,
+)
+
+
+class TestConnectionPool(TestCase):
+    def test_connection_is_reused(self):
+        _pool.clear()
+
+        get(PLAY_STORE_BASE_URL)
+        self.assertEqual(1, len(_pool._idle[("https", "play.google.com", 443)]))
+
+        idle_connection = _pool._idle[("https", "play.google.com", 443)][0]
+        get(PLAY_STORE_BASE_URL)
+        self.assertIs(
+            idle_connection, _pool._idle[("https", "play.google.com", 443)][0]
+        )
+
+    def test_pool_size_limits_idle_connections(self):
+        pool = ConnectionPool(pool_size=1)
+        key = ("https", "play.google.com", 443)
+
+        first, _ = pool._checkout(key)
+        second, _ = pool._checkout(key)
+        pool._checkin(key, first)
+        pool._checkin(key, second)
+
+        self.assertEqual([first], pool._idle[key])
+
+    def test_configure_pool_applies_to_async_pool(self):
+        defaults = (_pool.pool_size, _pool.timeout)
+        self.addCleanup(configure_pool, *defaults)
+
+        configure_pool(pool_size=2, timeout=1.5)
+
+        self.assertEqual(2, async_request._pool.pool_size)
+        self.assertEqual(1.5, async_request._pool.timeout)
+        self.assertEqual((2, 1.5), (_pool.pool_size, _pool.timeout))
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.targets.append(self.path)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def do_CONNECT(self):
+        self.server.targets.append(self.path)
+        self.send_response(407)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestProxy(TestCase):
+    def setUp(self):
+        self.server = HTTPServer(("127.0.0.1", 0), _ProxyHandler)
+        self.server.targets = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        proxy = "http://127.0.0.1:{}".format(self.server.server_port)
+        environ = patch.dict(
+            os.environ, {"http_proxy": proxy, "https_proxy": proxy}, clear=True
+        )
+        environ.start()
+        self.addCleanup(environ.stop)
+
+    def test_proxy_from_environment(self):
+        with patch.dict(
+            os.environ,
+            {"https_proxy": "user:p%40ss@proxy.local:3128", "no_proxy": "localhost"},
+            clear=True,
+        ):
+            credentials = base64.b64encode(b"user:p@ss").decode("ascii")
+            self.assertEqual(
+                _Proxy(
+                    "proxy.local",
+                    3128,
+                    {"Proxy-Authorization": "Basic " + credentials},
+                ),
+                _proxy_for("https", "play.google.com"),
+            )
+            self.assertIsNone(_proxy_for("https", "localhost"))
+            self.assertIsNone(_proxy_for("http", "play.google.com"))
+
+    def test_http_request_goes_through_proxy(self):
+        url = "http://play.example/store/apps?id=1"
+
+        status, _, body = ConnectionPool().request("GET", url)
+        self.assertEqual((200, b"ok"), (status, body))
+
+        status, _, body = asyncio.run(
+            async_request.AsyncConnectionPool().request("GET", url)
+        )
+        self.assertEqual((200, b"ok"), (status, body))
+
+        self.assertEqual([url, url], self.server.targets)
+
+    def test_https_request_tunnels_through_proxy(self):
+        url = "https://play.example/store/apps"
+
+        with self.assertRaisesRegex(OSError, "407"):
+            ConnectionPool().request("GET", url)
+        with self.assertRaisesRegex(OSError, "407"):
+            asyncio.run(async_request.AsyncConnectionPool().request("GET", url))
+
+        self.assertEqual(["play.example:443"] * 2, self.server.targets)
+
+
+class _KeepAliveHandler(_ProxyHandler):
+    protocol_version = "HTTP/1.1"
+
+
+class TestAsyncConnectionPool(TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        self.server.targets = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.key = ("http", "127.0.0.1", self.server.server_port)
+        self.url = "http://127.0.0.1:{}/".format(self.server.server_port)
+
+    def test_idle_connections_are_kept_per_event_loop(self):
+        pool = async_request.AsyncConnectionPool()
+        self.addCleanup(pool.clear)
+        first_loop = asyncio.new_event_loop()
+        self.addCleanup(first_loop.close)
+
+        first_loop.run_until_complete(pool.request("GET", self.url))
+        first = pool._idle[first_loop][self.key]
+        self.assertEqual(1, len(first))
+        connection = first[0]
+
+        # Another loop opens its own connection and leaves the first alone.
+        asyncio.run(pool.request("GET", self.url))
+        self.assertIs(first, pool._idle[first_loop][self.key])
+        self.assertEqual(1, len(first))
+
+        first_loop.run_until_complete(pool.request("GET", self.url))
+        self.assertEqual([connection], first)
+
+        first_loop.close()
+        asyncio.run(pool.request("GET", self.url))
+        self.assertNotIn(first_loop, pool._idle)
+        self.assertEqual(4, len(self.server.targets))
@@ -0,0 +1,110 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from google_play_scraper.exceptions import (
+    ExtraHTTPError,
+    NotFoundError,
+    PlayGatewayError,
+)
+from google_play_scraper.features.reviews import reviews
+from google_play_scraper.utils import request
+from google_play_scraper.utils.rate_limit import RateLimiter
+from google_play_scraper.utils.retry import RetryPolicy
+
+
+class TestRetryPolicy(TestCase):
+    def test_classification(self):
+        policy = RetryPolicy()
+
+        self.assertTrue(policy.retryable(PlayGatewayError()))
+        self.assertTrue(policy.retryable(ConnectionResetError()))
+        self.assertTrue(policy.retryable(ExtraHTTPError("", 503)))
+        self.assertTrue(policy.retryable(ExtraHTTPError("", 429)))
+        self.assertFalse(policy.retryable(ExtraHTTPError("", 400)))
+        self.assertFalse(policy.retryable(ExtraHTTPError("Too many redirects.")))
+        self.assertFalse(policy.retryable(NotFoundError()))
+        self.assertFalse(policy.retryable(ValueError()))
+
+    def test_backoff_with_jitter(self):
+        policy = RetryPolicy(base_delay=1, max_delay=5)
+
+        for attempt, cap in [(1, 1), (2, 2), (3, 4), (4, 5), (10, 5)]:
+            delays = [policy.delay(attempt) for _ in range(100)]
+            self.assertTrue(all(0 <= delay <= cap for delay in delays))
+            self.assertGreater(len(set(delays)), 1)
+
+    def test_budget(self):
+        policy = RetryPolicy(
+            max_attempts=100, budget_ratio=0.5, budget_min_per_second=0
+        )
+
+        retries = 0
+        while policy.should_retry(ConnectionResetError(), 1):
+            retries += 1
+        self.assertEqual(10, retries)
+
+        for _ in range(4):
+            policy.started()
+        self.assertTrue(policy.should_retry(ConnectionResetError(), 1))
+        self.assertTrue(policy.should_retry(ConnectionResetError(), 1))
+        self.assertFalse(policy.should_retry(ConnectionResetError(), 1))
+
+        self.assertEqual((4, 12, 2), policy.stats())
+
+
+class TestWithRetries(TestCase):
+    def setUp(self):
+        patches = [
+            patch.object(request, "_retry_policy", RetryPolicy(base_delay=0)),
+            patch.object(request, "_limiter", RateLimiter()),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def test_get_retries_transient_errors(self):
+        responses = [ConnectionResetError(), (200, {}, b"ok")]
+
+        def respond(*args):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        with patch.object(request._pool, "request", side_effect=respond):
+            self.assertEqual("ok", request.get("https://play.google.com/"))
+
+        self.assertEqual((1, 1, 0), request.retry_stats())
+
+    def test_not_found_is_not_retried(self):
+        with patch.object(request._pool, "request", return_value=(404, {}, b"")) as m:
+            with self.assertRaises(NotFoundError) as context:
+                request.post("https://play.google.com/", "", {})
+
+        self.assertEqual(1, m.call_count)
+        self.assertEqual(1, context.exception.attempts)
+
+    def test_gives_up_after_max_attempts(self):
+        with patch.object(request._pool, "request", return_value=(503, {}, b"")) as m:
+            with self.assertRaises(ExtraHTTPError) as context:
+                request.get("https://play.google.com/")
+
+        self.assertEqual(3, m.call_count)
+        self.assertEqual(3, context.exception.attempts)
+        self.assertEqual(503, context.exception.status)
+
+    def test_page_retries_are_charged_to_the_budget(self):
+        policy = RetryPolicy(base_delay=0, budget_min_per_second=0)
+        while policy.should_retry(TimeoutError(), 1):
+            pass
+        exhausted = policy.stats().budget_exhausted
+
+        with patch("google_play_scraper.features.reviews._retry_policy", policy), patch(
+            "google_play_scraper.features.reviews._fetch_review_items",
+            side_effect=TimeoutError,
+        ) as m:
+            _, continuation_token = reviews("app")
+
+        self.assertEqual(1, m.call_count)
+        self.assertTrue(continuation_token.partial)
+        self.assertEqual(exhausted + 1, policy.stats().budget_exhausted)
@@ -5,11 +5,21 @@ from unittest.mock import patch
 from urllib.parse import urlparse
 
 from google_play_scraper import Sort
+from google_play_scraper.exceptions import NotFoundError
 from google_play_scraper.features.reviews import (
+    Review,
     _ContinuationToken,
+    _PageSizeController,
+    _extract_review_columns,
+    _extract_reviews,
     _fetch_review_items,
     reviews,
+    reviews_batch,
+    reviews_frame,
+    reviews_since,
 )
+from google_play_scraper.utils.retry import RetryPolicy
+from tests.e2e_tests.fakes import raw_review
 
 
 class TestReviews(TestCase):
@@ -250,3 +260,125 @@ class TestReviews(TestCase):
         self.assertEqual(Sort.NEWEST, ct.sort)
         self.assertEqual(100, ct.count)
         self.assertIsNone(ct.filter_score_with)
+
+    def test_batch_first_pages(self):
+        app_ids = ["com.mojang.minecraftpe", "com.spotify.music"]
+
+        result = reviews_batch(app_ids, count=20)
+
+        self.assertListEqual(app_ids, list(result))
+        for app_id in app_ids:
+            first_page, continuation_token = result[app_id]
+            self.assertEqual(20, len(first_page))
+            self.assertIsNotNone(continuation_token.token)
+
+            second_page, _ = reviews(app_id, continuation_token=continuation_token)
+            self.assertEqual(20, len(second_page))
+
+    def test_review_records(self):
+        item = raw_review(
+            "id", thumbs_up=3, reply="reply", user_name="name", user_image="img"
+        )
+
+        (expected,) = _extract_reviews([item])
+        (record,) = _extract_reviews([item], Review)
+
+        self.assertEqual(1700000000, record._at)
+        self.assertEqual(datetime.fromtimestamp(1700000000), record.at)
+        self.assertEqual("reply", record["replyContent"])
+        self.assertDictEqual(expected, dict(record))
+        self.assertEqual(expected, record)
+
+    def test_invalid_record_type(self):
+        with self.assertRaises(ValueError):
+            reviews("com.mojang.minecraftpe", record_type=tuple)
+
+    def test_review_columns(self):
+        items = [
+            raw_review("a", thumbs_up=3),
+            raw_review("b", 1, at=None, reply="reply"),
+        ]
+
+        columns = _extract_review_columns(items)
+
+        self.assertListEqual(["a", "b"], columns["reviewId"])
+        self.assertListEqual([5, 1], columns["score"])
+        self.assertListEqual([1700000000, None], columns["at"])
+        self.assertListEqual([None, 1700000100], columns["repliedAt"])
+
+    def test_frame(self):
+        frame, continuation_token = reviews_frame("com.mojang.minecraftpe", count=150)
+
+        self.assertEqual(150, len(frame))
+        self.assertListEqual(list(Review._fields), list(frame.columns))
+        self.assertEqual("UTC", str(frame["at"].dt.tz))
+        self.assertIsNotNone(continuation_token.token)
+
+        table, _ = reviews_frame("com.mojang.minecraftpe", count=20, output="arrow")
+
+        self.assertEqual(20, table.num_rows)
+
+    def test_since(self):
+        newest, _ = reviews("com.mojang.minecraftpe", count=10)
+
+        result, next_checkpoint = reviews_since(
+            "com.mojang.minecraftpe", since={r["reviewId"] for r in newest[5:]}
+        )
+
+        self.assertTrue(len(result) >= 5)
+        self.assertEqual(max(r["at"] for r in result), next_checkpoint.at)
+
+        result, _ = reviews_since("com.mojang.minecraftpe", since=next_checkpoint)
+
+        self.assertTrue(all(r["at"] >= next_checkpoint.at for r in result))
+
+    def test_page_size_controller(self):
+        controller = _PageSizeController(max_size=1000, min_size=100, target_seconds=2)
+
+        controller.succeeded(4)
+        self.assertEqual(500, controller.size)
+        controller.failed(300)
+        self.assertEqual(150, controller.size)
+        controller.failed(150)
+        self.assertEqual(100, controller.size)
+        controller.succeeded(0.5)
+        self.assertEqual(200, controller.size)
+
+    @patch(
+        "google_play_scraper.features.reviews._retry_policy",
+        RetryPolicy(base_delay=0),
+    )
+    def test_failed_pages_are_retried_smaller_then_reported(self):
+        counts = []
+
+        def fetch(url, app_id, sort, count, *args):
+            counts.append(count)
+            if count > 1000:
+                raise TimeoutError
+            return [], None
+
+        with patch("google_play_scraper.features.reviews._fetch_review_items", fetch):
+            _, continuation_token = reviews("com.mojang.minecraftpe", count=3000)
+
+            self.assertListEqual([3000, 1500, 750], counts)
+            self.assertFalse(continuation_token.partial)
+
+        with patch(
+            "google_play_scraper.features.reviews._fetch_review_items",
+            side_effect=TimeoutError,
+        ) as m:
+            result, continuation_token = reviews("com.mojang.minecraftpe")
+
+            self.assertEqual(5, m.call_count)
+            self.assertListEqual([], result)
+            self.assertTrue(continuation_token.partial)
+            self.assertIsInstance(continuation_token.error, TimeoutError)
+
+        with patch(
+            "google_play_scraper.features.reviews._fetch_review_items",
+            side_effect=NotFoundError,
+        ) as m:
+            _, continuation_token = reviews("com.mojang.minecraftpe")
+
+            self.assertEqual(1, m.call_count)
+            self.assertIsInstance(continuation_token.error, NotFoundError)
@@ -1,16 +1,55 @@
+import asyncio
+import os
+from datetime import datetime
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest.mock import patch
 
-from google_play_scraper.features.reviews import reviews, reviews_all
+from google_play_scraper import Priority
+from google_play_scraper.features.reviews import (
+    _fetch_review_items,
+    _plan_shards,
+    reviews,
+    reviews_all,
+    reviews_all_frame,
+    reviews_all_locales,
+    reviews_iter,
+    reviews_iter_async,
+    reviews_since,
+)
+from google_play_scraper.utils.bloom import BloomFilter
+from google_play_scraper.utils.retry import RetryPolicy
+from tests.e2e_tests.fakes import raw_review
+
+
+def fake_fetch(url, app_id, sort, count, score, device, token, priority):
+    """
+    Serve 35 reviews with ids "0".."34" in pages of 10, newest first.
+    """
+    start = int(token or 0)
+    items = [
+        raw_review(str(i), at=1700000000 - i) for i in range(start, min(start + 10, 35))
+    ]
+    return items, (str(start + 10) if start + 10 < 35 else None)
+
+
+def failing_fetch(url, app_id, sort, count, score, device, token, priority):
+    """
+    Like ``fake_fetch``, but every page after the first times out.
+    """
+    if token is not None:
+        raise TimeoutError
+    return fake_fetch(url, app_id, sort, count, score, device, token, priority)
 
 
 class TestReviewsAll(TestCase):
     def test_request_once(self):
         with patch(
-            "google_play_scraper.features.reviews.reviews", wraps=reviews
-        ) as mock_reviews:
+            "google_play_scraper.features.reviews._fetch_review_items",
+            wraps=_fetch_review_items,
+        ) as mock_fetch:
             result = reviews_all("co.kr.uaram.userdeliver_")
-            self.assertEqual(1, mock_reviews.call_count)
+            self.assertEqual(1, mock_fetch.call_count)
 
         result_of_reviews, _ = reviews("co.kr.uaram.userdeliver_", count=10000)
 
@@ -18,10 +57,7 @@ class TestReviewsAll(TestCase):
         self.assertEqual(len(result), len(result_of_reviews))
 
     def test_request_multiple_times(self):
-        with patch(
-            "google_play_scraper.features.reviews.reviews", wraps=reviews
-        ) as mock_reviews:
-            result = reviews_all("co.kr.uaram.userdeliver_", lang="ko", country="kr")
+        result = reviews_all("co.kr.uaram.userdeliver_", lang="ko", country="kr")
 
         result_of_reviews, _ = reviews(
             "co.kr.uaram.userdeliver_", lang="ko", country="kr", count=10000
@@ -34,3 +70,209 @@ class TestReviewsAll(TestCase):
         result = reviews_all("product.dp.io.ab180blog", lang="sw", country="it")
 
         self.assertListEqual([], result)
+
+    def test_iter_pages_resume_from_token(self):
+        pages = reviews_iter(
+            "co.kr.uaram.userdeliver_", lang="ko", country="kr", by_page=True
+        )
+        first_page, continuation_token = next(pages)
+        pages.close()
+
+        rest = list(
+            reviews_iter(
+                "co.kr.uaram.userdeliver_", continuation_token=continuation_token
+            )
+        )
+        result = reviews_all("co.kr.uaram.userdeliver_", lang="ko", country="kr")
+
+        self.assertEqual(len(result), len(first_page) + len(rest))
+
+    def test_parallel(self):
+        result = reviews_all("co.kr.uaram.userdeliver_", lang="ko", country="kr")
+        parallel_result = reviews_all(
+            "co.kr.uaram.userdeliver_",
+            lang="ko",
+            country="kr",
+            parallel=True,
+            order_by_at=True,
+        )
+
+        self.assertSetEqual(
+            {r["reviewId"] for r in result}, {r["reviewId"] for r in parallel_result}
+        )
+        self.assertEqual(len(result), len(parallel_result))
+        self.assertListEqual(
+            sorted([r["at"] for r in parallel_result], reverse=True),
+            [r["at"] for r in parallel_result],
+        )
+
+    def test_plan_shards(self):
+        self.assertListEqual(
+            [(5, None), (1, None), (4, None)],
+            _plan_shards([30, 0, 0, 5, 40], None, None),
+        )
+        self.assertEqual(5, len(_plan_shards(None, None, 2)))
+        self.assertListEqual([(1, None)], _plan_shards(None, 1, None))
+        self.assertListEqual([(1, 2)], _plan_shards(None, 1, 2))
+
+    def test_locales(self):
+        locales = [("ko", "kr"), ("en", "kr"), ("en", "us")]
+
+        result, seen_in = reviews_all_locales("co.kr.uaram.userdeliver_", locales)
+
+        self.assertEqual(len(result), len({r["reviewId"] for r in result}))
+        self.assertSetEqual({r["reviewId"] for r in result}, set(seen_in))
+        for review_locales in seen_in.values():
+            self.assertTrue(set(review_locales) <= set(locales))
+
+    def test_prefetch(self):
+        with patch(
+            "google_play_scraper.features.reviews._fetch_review_items", fake_fetch
+        ):
+            pages = list(reviews_iter("app", by_page=True, prefetch=True))
+
+        self.assertListEqual([10, 10, 10, 5], [len(page) for page, _ in pages])
+        self.assertListEqual(
+            [str(i) for i in range(35)],
+            [review["reviewId"] for page, _ in pages for review in page],
+        )
+        self.assertEqual("10", pages[0][1].token)
+        self.assertIsNone(pages[-1][1].token)
+
+    def test_seen_filter(self):
+        with TemporaryDirectory() as directory:
+            with BloomFilter(os.path.join(directory, "app")) as seen:
+                for i in range(5, 30):
+                    seen.add(str(i))
+
+                with patch(
+                    "google_play_scraper.features.reviews._fetch_review_items",
+                    fake_fetch,
+                ):
+                    result = list(reviews_iter("app", seen=seen))
+
+                self.assertEqual(35, len(seen))
+
+        self.assertListEqual(
+            [str(i) for i in [0, 1, 2, 3, 4, 30, 31, 32, 33, 34]],
+            [review["reviewId"] for review in result],
+        )
+
+    def test_seen_filter_only_marks_delivered_reviews(self):
+        fetch = "google_play_scraper.features.reviews._fetch_review_items"
+
+        with TemporaryDirectory() as directory:
+            with BloomFilter(os.path.join(directory, "app")) as seen, patch(
+                fetch, fake_fetch
+            ):
+                stopped = list(
+                    reviews_iter(
+                        "app", seen=seen, stop_when=lambda r: r["reviewId"] == "3"
+                    )
+                )
+
+                pages = reviews_iter("app", seen=seen)
+                closed = [next(pages), next(pages)]
+                pages.close()
+
+                rest = list(reviews_iter("app", seen=seen))
+
+                with self.assertRaises(ValueError):
+                    reviews_all("app", parallel=True, seen=seen)
+                with self.assertRaises(ValueError):
+                    reviews_all_locales("app", [("en", "us")], seen=seen)
+
+        self.assertListEqual(["0", "1", "2"], [r["reviewId"] for r in stopped])
+        self.assertListEqual(["3", "4"], [r["reviewId"] for r in closed])
+        self.assertListEqual(
+            [str(i) for i in range(4, 35)], [r["reviewId"] for r in rest]
+        )
+
+    def test_locales_overlapping_in_any_order_are_redundant(self):
+        def fetch(url, app_id, sort, count, score, device, token, priority):
+            items, token = fake_fetch(
+                url, app_id, sort, count, score, device, token, priority
+            )
+            if "gl=us" in url:
+                # Same reviews, another order, plus one of its own.
+                items = (
+                    items[::-1] + [raw_review("us-only")] if token == "10" else items
+                )
+            elif "gl=de" in url:
+                items = [raw_review("de-" + item[0]) for item in items]
+            return items, token
+
+        locales = [("en", "kr"), ("en", "us"), ("de", "de")]
+        with patch("google_play_scraper.features.reviews._fetch_review_items", fetch):
+            result, seen_in = reviews_all_locales("app", locales, max_workers=1)
+
+        self.assertEqual(71, len(result))
+        self.assertListEqual(locales[:2], seen_in["0"])
+        self.assertListEqual(locales[:2], seen_in["20"])
+        self.assertListEqual([("en", "us")], seen_in["us-only"])
+        self.assertListEqual([("de", "de")], seen_in["de-0"])
+
+    @patch(
+        "google_play_scraper.features.reviews._retry_policy",
+        RetryPolicy(base_delay=0),
+    )
+    def test_since_keeps_checkpoint_when_a_page_fails(self):
+        since = datetime.fromtimestamp(1600000000)
+
+        with patch(
+            "google_play_scraper.features.reviews._fetch_review_items", failing_fetch
+        ):
+            with self.assertWarns(RuntimeWarning):
+                result, checkpoint = reviews_since("app", since=since)
+
+        self.assertEqual(10, len(result))
+        self.assertEqual(since, checkpoint.at)
+        self.assertEqual(frozenset(), checkpoint.review_ids)
+
+    @patch(
+        "google_play_scraper.features.reviews._retry_policy",
+        RetryPolicy(base_delay=0),
+    )
+    def test_crawls_warn_when_a_page_fails(self):
+        async def iterate():
+            return [review async for review in reviews_iter_async("app")]
+
+        crawls = {
+            "reviews_iter": lambda: list(reviews_iter("app")),
+            "reviews_iter_async": lambda: asyncio.run(iterate()),
+            "reviews_all_frame": lambda: reviews_all_frame("app"),
+            "reviews_all_locales": lambda: reviews_all_locales("app", [("en", "us")])[
+                0
+            ],
+        }
+
+        async def failing_fetch_async(*args):
+            return failing_fetch(*args)
+
+        for name, crawl in crawls.items():
+            with self.subTest(name), patch(
+                "google_play_scraper.features.reviews._fetch_review_items",
+                failing_fetch,
+            ), patch(
+                "google_play_scraper.features.reviews._fetch_review_items_async",
+                failing_fetch_async,
+            ):
+                with self.assertWarns(RuntimeWarning):
+                    result = crawl()
+
+                self.assertEqual(10, len(result))
+
+    def test_crawls_default_to_bulk_priority(self):
+        priorities = set()
+
+        def fetch(*args):
+            priorities.add(args[-1])
+            return fake_fetch(*args)
+
+        with patch("google_play_scraper.features.reviews._fetch_review_items", fetch):
+            reviews_all("app")
+            self.assertSetEqual({Priority.BULK}, priorities)
+
+            priorities.clear()
+            reviews("app")
+            self.assertSetEqual({Priority.INTERACTIVE}, priorities)
@@ -54,3 +54,10 @@ class TestSearch(TestCase):
         n_hits = 3
         results = search("best Pikachu game", n_hits=n_hits)
         self.assertEqual(len(results), n_hits)
+
+    def test_fields(self):
+        results = search("best Pikachu game", n_hits=3, fields=["appId", "score"])
+
+        self.assertEqual(3, len(results))
+        for result in results:
+            self.assertListEqual(["appId", "score"], list(result))
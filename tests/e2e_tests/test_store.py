@@ -0,0 +1,71 @@
+import os
+from datetime import datetime
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from google_play_scraper import ReviewStore
+from google_play_scraper.features.reviews import Review, _extract_reviews
+from google_play_scraper.utils.checkpoint import SQLiteCheckpoint
+from tests.e2e_tests.fakes import raw_review
+
+
+class TestReviewStore(TestCase):
+    def test_upsert_and_query(self):
+        store = ReviewStore()
+        store.upsert(
+            "app",
+            _extract_reviews(
+                [raw_review("a", 5, 1700000000), raw_review("b", 1, 1700000100)]
+            ),
+        )
+        store.upsert(
+            "app",
+            _extract_reviews([raw_review("a", 2, 1700000200, version="2.0")], Review),
+        )
+
+        self.assertEqual(2, store.count("app"))
+        self.assertEqual(0, store.count("other"))
+
+        result = store.query("app")
+        self.assertListEqual(["a", "b"], [r["reviewId"] for r in result])
+        self.assertEqual(2, result[0]["score"])
+        self.assertEqual(datetime.fromtimestamp(1700000200), result[0]["at"])
+
+        self.assertListEqual(
+            ["b"], [r["reviewId"] for r in store.query("app", score=1)]
+        )
+        self.assertListEqual(
+            ["a"],
+            [
+                r.reviewId
+                for r in store.query("app", app_version="2.0", record_type=Review)
+            ],
+        )
+        self.assertListEqual(
+            ["b"],
+            [
+                r["reviewId"]
+                for r in store.query(
+                    "app",
+                    since=datetime.fromtimestamp(1700000050),
+                    until=datetime.fromtimestamp(1700000150),
+                )
+            ],
+        )
+
+    def test_sink_shares_checkpoint_transaction(self):
+        with TemporaryDirectory() as directory:
+            checkpoint = SQLiteCheckpoint(os.path.join(directory, "reviews.db"))
+            store = ReviewStore(checkpoint.connection)
+            sink = store.sink("app", commit=False)
+
+            def deliver():
+                sink(_extract_reviews([raw_review("a", 5, 1700000000)]), 1)
+                raise RuntimeError
+
+            with self.assertRaises(RuntimeError):
+                checkpoint.commit({"pages": 1}, deliver)
+
+            self.assertEqual(0, store.count("app"))
+            self.assertIsNone(checkpoint.load())
+            checkpoint.close()